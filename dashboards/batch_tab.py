@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import glob
+import inspect
 import json
 import time
 from pathlib import Path
@@ -42,18 +44,15 @@ async def _run_once(task_text: str, corpus_paths: list[str] | None, cfg: dict[st
                 [(cfg.get("allowed_models") or {}).get(p, []) for p in ("openai", "anthropic", "google")], []
             ),
         )
-        if hasattr(drafts, "__await__"):
-            import asyncio
-
-            drafts = asyncio.get_event_loop().run_until_complete(drafts)
+        # Already inside run_batch's event loop: await rather than nesting run_until_complete
+        if inspect.isawaitable(drafts):
+            drafts = await drafts
 
         judgment = judge_drafts(
             drafts=drafts, task=task_text, require_citations=2 if grounded else 0, corpus_docs=corpus_docs
         )
-        if hasattr(judgment, "__await__"):
-            import asyncio
-
-            judgment = asyncio.get_event_loop().run_until_complete(judgment)
+        if inspect.isawaitable(judgment):
+            judgment = await judgment
 
         status, provider, text, reason, redaction = select_publish_text(judgment)
 
@@ -157,14 +156,14 @@ def render_batch_tab(cfg: dict[str, Any]):
                 p.write_bytes(f.read())
                 local_corpus.append(str(p))
 
-        import asyncio
         from concurrent.futures import ThreadPoolExecutor
 
         save_dir = "runs/ui/batch"
         prog_file = Path(save_dir) / "progress.json"
 
         def _runner():
-            return asyncio.get_event_loop().run_until_complete(
+            # Worker thread has no current loop; asyncio.run creates and closes one cleanly
+            return asyncio.run(
                 run_batch(
                     tasks,
                     _run_once,
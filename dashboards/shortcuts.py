@@ -47,6 +47,8 @@ class ShortcutRegistry:
 
     def __init__(self):
         self._actions: dict[str, ShortcutAction] = {}
+        # Lowercased (label, description, category) per action, computed at register time
+        self._lc: dict[str, tuple[str, str, str]] = {}
         self._register_default_actions()
 
     def _register_default_actions(self):
@@ -212,10 +214,12 @@ def _register_default_actions(self):
     def register(self, action: ShortcutAction):
         """Register an action in the registry."""
         self._actions[action.action_id] = action
+        self._lc[action.action_id] = (action.label.lower(), action.description.lower(), action.category.lower())
 
     def unregister(self, action_id: str):
         """Unregister an action."""
         self._actions.pop(action_id, None)
+        self._lc.pop(action_id, None)
 
     def get_action(self, action_id: str) -> Optional[ShortcutAction]:
         """Get action by ID."""
@@ -236,20 +240,23 @@ def get_enabled_actions(self) -> list[ShortcutAction]:
     def search_actions(self, query: str) -> list[ShortcutAction]:
         """Fuzzy search actions by label or description."""
         query_lower = query.lower()
+        lowered = self._lc
         results = []
 
         for action in self.get_enabled_actions():
+            label_lc, desc_lc, category_lc = lowered[action.action_id]
+
             # Simple fuzzy matching
-            label_match = query_lower in action.label.lower()
-            desc_match = query_lower in action.description.lower()
-            category_match = query_lower in action.category.lower()
+            label_match = query_lower in label_lc
+            desc_match = query_lower in desc_lc
+            category_match = query_lower in category_lc
 
             if label_match or desc_match or category_match:
                 # Calculate relevance score (simple heuristic)
                 score = 0
                 if label_match:
                     score += 10
-                if action.label.lower().startswith(query_lower):
+                if label_lc.startswith(query_lower):
                     score += 5
                 if desc_match:
                     score += 3
@@ -264,17 +271,16 @@ def search_actions(self, query: str) -> list[ShortcutAction]:
 
     def execute_action(self, action_id: str, context: Optional[dict[str, Any]] = None) -> Any:
         """Execute action callback if registered."""
-        action = self.get_action(action_id)
-        if not action:
-            raise ValueError(f"Action not found: {action_id}")
+        try:
+            action = self._actions[action_id]
+        except KeyError:
+            raise ValueError(f"Action not found: {action_id}") from None
 
         if not action.enabled:
             raise ValueError(f"Action disabled: {action_id}")
 
-        if action.callback:
-            return action.callback(context or {})
-
-        return None
+        callback = action.callback
+        return callback(context or {}) if callback else None
 
     def get_shortcuts_by_key(self, key: str) -> list[ShortcutAction]:
         """Get actions bound to a specific keyboard shortcut."""
@@ -1,16 +1,26 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import inspect
 import json
+import shutil
 import time
+from dataclasses import asdict
 from datetime import date as date_type
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 import streamlit as st
+import ujson
 
 from src.config_ui import to_allowed_models
+from src.publish import select_publish_text
 from src.templates import (
+    CUSTOM_TEMPLATES_DIR,
+    TEMPLATES_DIR,
     InputDef,
+    TemplateDef,
     TemplateRenderError,
     check_budget,
     clone_template,
@@ -27,159 +37,274 @@
     validate_inputs,
 )
 
+# Real DJP path is optional (needs the agents SDK); resolve it once at import time
+try:
+    from src.corpus import load_corpus
+    from src.debate import run_debate
+    from src.judge import judge_drafts
+
+    DJP_AVAILABLE = True
+except ImportError:
+    DJP_AVAILABLE = False
+
+
+async def _drive_djp(draft_text: str, grounded: bool, local_corpus, cfg: dict[str, Any]):
+    """Run debate then judge inside a single event loop. Returns (drafts, judgment)."""
+    # Corpus parsing (PDF/MD) is blocking disk I/O; keep it off the event loop thread
+    corpus_docs = await asyncio.to_thread(load_corpus, local_corpus) if grounded else None
+    drafts = run_debate(
+        task=draft_text,
+        max_tokens=int(cfg.get("max_tokens", 1000)),
+        temperature=float(cfg.get("temperature", 0.3)),
+        corpus_docs=corpus_docs,
+        allowed_models=to_allowed_models(cfg),
+    )
+    if inspect.iscoroutine(drafts):
+        drafts = await drafts
+    judgment = judge_drafts(
+        drafts=drafts, task=draft_text, require_citations=2 if grounded else 0, corpus_docs=corpus_docs
+    )
+    if inspect.iscoroutine(judgment):
+        judgment = await judgment
+    return drafts, judgment
+
+
+def _templates_signature() -> tuple[tuple[str, int], ...]:
+    """Fingerprint template YAML files by (path, mtime) so edits invalidate the cache."""
+    return tuple(
+        sorted((str(p), p.stat().st_mtime_ns) for d in (TEMPLATES_DIR, CUSTOM_TEMPLATES_DIR) for p in d.glob("*.yaml"))
+    )
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_list_templates(signature: tuple[tuple[str, int], ...]) -> list[TemplateDef]:
+    """Parse templates once per signature instead of on every Streamlit rerun."""
+    return list_templates()
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _render_cached(
+    _template: TemplateDef, key: str, version: str, definition: str, vars_key: str, _variables: dict[str, Any]
+) -> str:
+    """Render once per (template, variables); underscore args are excluded from the cache key."""
+    return render_template(_template, _variables)
+
+
+def _template_fingerprint(template: TemplateDef) -> str:
+    """Digest of the fields render and validation read, so edits that keep the version still invalidate caches."""
+    definition = {
+        "body": template.body,
+        "context": template.context,
+        "inputs": [asdict(i) for i in template.inputs],
+        "style": template.style,
+    }
+    payload = json.dumps(definition, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _vars_key(vars_state: dict[str, Any]) -> str:
+    """Stable fingerprint of input values (dates, lists) for cache keys."""
+    return json.dumps(vars_state, sort_keys=True, default=str)
+
+
+def _render(template: TemplateDef, vars_state: dict[str, Any]) -> str:
+    """Cached render_template for the preview, export and run paths."""
+    return _render_cached(
+        template, template.key, template.version, _template_fingerprint(template), _vars_key(vars_state), vars_state
+    )
+
+
+def _validate(template: TemplateDef, vars_state: dict[str, Any]) -> list[str]:
+    """validate_inputs, skipped when neither the template nor its values changed since the last rerun."""
+    key = (template.key, template.version, _template_fingerprint(template), _vars_key(vars_state))
+    if st.session_state.get("_tmpl_val_key") != key:
+        st.session_state["_tmpl_val_errors"] = validate_inputs(template, vars_state)
+        st.session_state["_tmpl_val_key"] = key
+    return st.session_state["_tmpl_val_errors"]
+
+
+def _usage_row(phase: str, obj: Any, provider: str = "") -> dict[str, Any]:
+    """Best-effort usage row for a draft or judgment; missing token counts default to 0."""
+    return {
+        "phase": phase,
+        "provider": getattr(obj, "provider", provider),
+        "prompt_tokens": int(getattr(obj, "prompt_tokens", 0)),
+        "completion_tokens": int(getattr(obj, "completion_tokens", 0)),
+        "latency_s": 0,
+    }
+
 
 # Optional: import real path; fallback to select() mock if not available
 def _run_once_real(draft_text: str, grounded: bool, local_corpus, cfg: dict[str, Any]):
     """Try real DJP; fallback to select(). Returns (status, provider, text, reason, redaction, usage_rows)."""
-    try:
-        from src.corpus import load_corpus
-        from src.debate import run_debate
-        from src.judge import judge_drafts
-        from src.publish import select_publish_text
-
-        corpus_docs = load_corpus(local_corpus) if grounded else None
-        drafts = run_debate(
-            task=draft_text,
-            max_tokens=int(cfg.get("max_tokens", 1000)),
-            temperature=float(cfg.get("temperature", 0.3)),
-            corpus_docs=corpus_docs,
-            allowed_models=to_allowed_models(cfg),
-        )
-        if hasattr(drafts, "__await__"):
-            import asyncio
-
-            drafts = asyncio.get_event_loop().run_until_complete(drafts)
-        judgment = judge_drafts(
-            drafts=drafts, task=draft_text, require_citations=2 if grounded else 0, corpus_docs=corpus_docs
-        )
-        if hasattr(judgment, "__await__"):
-            import asyncio
-
-            judgment = asyncio.get_event_loop().run_until_complete(judgment)
-        status, provider, text, reason, redaction = select_publish_text(judgment)
-        usage_rows = []
+    if DJP_AVAILABLE:
         try:
-            for d in drafts:
-                pr = getattr(d, "provider", "")
-                pt = int(getattr(d, "prompt_tokens", 0))
-                ct = int(getattr(d, "completion_tokens", 0))
+            drafts, judgment = asyncio.run(_drive_djp(draft_text, grounded, local_corpus, cfg))
+            status, provider, text, reason, redaction = select_publish_text(judgment)
+            usage_rows = []
+            try:
+                usage_rows = [_usage_row("debate", d) for d in drafts]
+                usage_rows.append(_usage_row("judge", judgment, provider or ""))
                 usage_rows.append(
-                    {"phase": "debate", "provider": pr, "prompt_tokens": pt, "completion_tokens": ct, "latency_s": 0}
+                    {
+                        "phase": "select",
+                        "provider": provider or "",
+                        "prompt_tokens": 0,
+                        "completion_tokens": 0,
+                        "latency_s": 0,
+                    }
                 )
-            pr = getattr(judgment, "provider", provider or "")
-            pt = int(getattr(judgment, "prompt_tokens", 0))
-            ct = int(getattr(judgment, "completion_tokens", 0))
-            usage_rows.append(
-                {"phase": "judge", "provider": pr, "prompt_tokens": pt, "completion_tokens": ct, "latency_s": 0}
-            )
-            usage_rows.append(
-                {
-                    "phase": "select",
-                    "provider": provider or "",
-                    "prompt_tokens": 0,
-                    "completion_tokens": 0,
-                    "latency_s": 0,
-                }
-            )
+            except Exception:
+                pass
+            return status, provider, text, reason, redaction, usage_rows
         except Exception:
             pass
-        return status, provider, text, reason, redaction, usage_rows
-    except Exception:
-        from src.publish import select_publish_text
 
-        status, provider, text, reason, redaction = select_publish_text({"text": draft_text, "grounded": grounded})
-        return status, provider, text, reason, redaction, []
+    status, provider, text, reason, redaction = select_publish_text({"text": draft_text, "grounded": grounded})
+    return status, provider, text, reason, redaction, []
 
 
-def _render_input_widget(inp: InputDef) -> Any:
-    """
-    Render appropriate Streamlit widget based on input type.
+def _widget_key(template: TemplateDef, inp: InputDef) -> str:
+    """Session-state key owning the widget value for one template input."""
+    return f"tmpl:{template.key}:{template.version}:{inp.id}"
 
-    Args:
-        inp: InputDef describing the input field
 
-    Returns:
-        User input value
-    """
-    help_text = inp.help if inp.help else None
-    label = f"{inp.label}{'*' if inp.required else ''}"
-
-    # String type
-    if inp.type == "string":
-        return st.text_input(label, value=str(inp.default or ""), help=help_text, placeholder=inp.placeholder or "")
-
-    # Text type (multiline)
-    elif inp.type == "text":
-        return st.text_area(
-            label, value=str(inp.default or ""), help=help_text, height=100, placeholder=inp.placeholder or ""
-        )
-
-    # Integer type
-    elif inp.type == "int":
-        min_val = inp.validators.get("min", 0)
-        max_val = inp.validators.get("max", 1000000)
-        default_val = int(inp.default) if inp.default is not None else min_val
-        return st.number_input(label, min_value=min_val, max_value=max_val, value=default_val, step=1, help=help_text)
-
-    # Float type
+def _widget_default(inp: InputDef) -> Any:
+    """Convert an input's declared default into the value its widget expects."""
+    if inp.type == "int":
+        return int(inp.default) if inp.default is not None else inp.validators.get("min", 0)
+
     elif inp.type == "float":
-        min_val = float(inp.validators.get("min", 0.0))
-        max_val = float(inp.validators.get("max", 1000000.0))
-        default_val = float(inp.default) if inp.default is not None else min_val
-        return st.number_input(
-            label, min_value=min_val, max_value=max_val, value=default_val, step=0.1, format="%.2f", help=help_text
-        )
-
-    # Boolean type
+        return float(inp.default) if inp.default is not None else float(inp.validators.get("min", 0.0))
+
     elif inp.type == "bool":
-        default_val = bool(inp.default) if inp.default is not None else False
-        return st.checkbox(label, value=default_val, help=help_text)
+        return bool(inp.default) if inp.default is not None else False
 
-    # Enum type (single select)
     elif inp.type == "enum":
         choices = inp.validators.get("choices", [])
         if not choices:
-            st.error(f"Enum field '{inp.label}' has no choices defined")
             return None
-        default_idx = 0
-        if inp.default and inp.default in choices:
-            default_idx = choices.index(inp.default)
-        return st.selectbox(label, choices, index=default_idx, help=help_text)
+        return inp.default if inp.default and inp.default in choices else choices[0]
 
-    # Multiselect type
     elif inp.type == "multiselect":
-        choices = inp.validators.get("choices", [])
-        if not choices:
-            st.error(f"Multiselect field '{inp.label}' has no choices defined")
-            return []
-        default_val = inp.default if isinstance(inp.default, list) else []
-        return st.multiselect(label, choices, default=default_val, help=help_text)
+        return inp.default if isinstance(inp.default, list) else []
 
-    # Date type
     elif inp.type == "date":
-        try:
-            if inp.default:
-                from datetime import datetime
+        if inp.default:
+            try:
+                return date_type.fromisoformat(str(inp.default))
+            except ValueError:
+                pass
+        return date_type.today()
 
-                default_val = datetime.strptime(str(inp.default), "%Y-%m-%d").date()
-            else:
-                default_val = date_type.today()
-        except Exception:
-            default_val = date_type.today()
-        return st.date_input(label, value=default_val, help=help_text)
+    # string, text, email, url and unknown types
+    return str(inp.default or "")
 
-    # Email type (text input with validation)
-    elif inp.type == "email":
-        return st.text_input(label, value=str(inp.default or ""), help=help_text, placeholder="user@example.com")
 
-    # URL type (text input with validation)
-    elif inp.type == "url":
-        return st.text_input(label, value=str(inp.default or ""), help=help_text, placeholder="https://example.com")
+def _ensure_defaults(template: TemplateDef) -> None:
+    """Seed widget state once so default conversions don't rerun on every Streamlit rerun."""
+    for inp in template.inputs:
+        key = _widget_key(template, inp)
+        if key not in st.session_state:
+            st.session_state[key] = _widget_default(inp)
 
-    # Fallback
-    else:
-        st.warning(f"Unknown input type: {inp.type}")
-        return st.text_input(label, value=str(inp.default or ""), help=help_text)
+
+def _label(inp: InputDef) -> str:
+    return f"{inp.label}{'*' if inp.required else ''}"
+
+
+def _help(inp: InputDef) -> str | None:
+    return inp.help if inp.help else None
+
+
+def _w_string(inp: InputDef, key: str) -> Any:
+    return st.text_input(_label(inp), key=key, help=_help(inp), placeholder=inp.placeholder or "")
+
+
+def _w_text(inp: InputDef, key: str) -> Any:
+    return st.text_area(_label(inp), key=key, help=_help(inp), height=100, placeholder=inp.placeholder or "")
+
+
+def _w_int(inp: InputDef, key: str) -> Any:
+    min_val = inp.validators.get("min", 0)
+    max_val = inp.validators.get("max", 1000000)
+    return st.number_input(_label(inp), min_value=min_val, max_value=max_val, step=1, key=key, help=_help(inp))
+
+
+def _w_float(inp: InputDef, key: str) -> Any:
+    min_val = float(inp.validators.get("min", 0.0))
+    max_val = float(inp.validators.get("max", 1000000.0))
+    return st.number_input(
+        _label(inp), min_value=min_val, max_value=max_val, step=0.1, format="%.2f", key=key, help=_help(inp)
+    )
+
+
+def _w_bool(inp: InputDef, key: str) -> Any:
+    return st.checkbox(_label(inp), key=key, help=_help(inp))
+
+
+def _w_enum(inp: InputDef, key: str) -> Any:
+    choices = inp.validators.get("choices", [])
+    if not choices:
+        st.error(f"Enum field '{inp.label}' has no choices defined")
+        return None
+    return st.selectbox(_label(inp), choices, key=key, help=_help(inp))
+
+
+def _w_multiselect(inp: InputDef, key: str) -> Any:
+    choices = inp.validators.get("choices", [])
+    if not choices:
+        st.error(f"Multiselect field '{inp.label}' has no choices defined")
+        return []
+    return st.multiselect(_label(inp), choices, key=key, help=_help(inp))
+
+
+def _w_date(inp: InputDef, key: str) -> Any:
+    return st.date_input(_label(inp), key=key, help=_help(inp))
+
+
+def _w_email(inp: InputDef, key: str) -> Any:
+    return st.text_input(_label(inp), key=key, help=_help(inp), placeholder="user@example.com")
+
+
+def _w_url(inp: InputDef, key: str) -> Any:
+    return st.text_input(_label(inp), key=key, help=_help(inp), placeholder="https://example.com")
+
+
+def _w_fallback(inp: InputDef, key: str) -> Any:
+    st.warning(f"Unknown input type: {inp.type}")
+    return st.text_input(_label(inp), key=key, help=_help(inp))
+
+
+# Widget renderer per InputDef.type; unknown types fall back to a plain text input
+_WIDGET_DISPATCH: dict[str, Callable[[InputDef, str], Any]] = {
+    "string": _w_string,
+    "text": _w_text,
+    "int": _w_int,
+    "float": _w_float,
+    "bool": _w_bool,
+    "enum": _w_enum,
+    "multiselect": _w_multiselect,
+    "date": _w_date,
+    "email": _w_email,
+    "url": _w_url,
+}
+
+
+def _render_input_widget(inp: InputDef, key: str) -> Any:
+    """
+    Render appropriate Streamlit widget based on input type.
+
+    The widget value is owned by ``st.session_state[key]``, seeded by ``_ensure_defaults``.
+
+    Args:
+        inp: InputDef describing the input field
+        key: Session-state key for the widget
+
+    Returns:
+        User input value
+    """
+    return _WIDGET_DISPATCH.get(inp.type, _w_fallback)(inp, key)
 
 
 def render_templates_tab():
@@ -188,7 +313,7 @@ def render_templates_tab():
     st.caption("Pick a template, edit variables, preview, run via DJP, and export results.")
 
     # Load templates
-    tdefs = list_templates()
+    tdefs = _cached_list_templates(_templates_signature())
     if not tdefs:
         st.info("No templates found. Add YAML files to ./templates/")
         st.info("Templates must conform to schemas/template.json")
@@ -237,16 +362,23 @@ def render_templates_tab():
 
     # Input form
     st.markdown("#### Input Variables")
-    vars_state: dict[str, Any] = {}
-
-    for inp in template.inputs:
-        value = _render_input_widget(inp)
-        vars_state[inp.id] = value
+    live_vars = st.checkbox("Live update", value=False, help="Apply each change immediately instead of on Apply")
+    _ensure_defaults(template)
+    if live_vars:
+        for inp in template.inputs:
+            _render_input_widget(inp, _widget_key(template, inp))
+    else:
+        # Form defers reruns until Apply, so N field edits cost one rerun instead of N
+        with st.form(f"tmpl_vars:{template.key}"):
+            for inp in template.inputs:
+                _render_input_widget(inp, _widget_key(template, inp))
+            st.form_submit_button("Apply")
+    vars_state: dict[str, Any] = {inp.id: st.session_state[_widget_key(template, inp)] for inp in template.inputs}
 
     st.markdown("---")
 
     # Validate inputs
-    validation_errors = validate_inputs(template, vars_state)
+    validation_errors = _validate(template, vars_state)
     if validation_errors:
         st.error("**Validation Errors:**")
         for err in validation_errors:
@@ -307,8 +439,12 @@ def render_templates_tab():
     if preview_btn:
         st.markdown("#### Preview")
         try:
-            preview_text = render_template(template, vars_state)
-            st.code(preview_text, language="markdown")
+            preview_text = _render(template, vars_state)
+            # Highlighting only pays off for markup; plain text skips client-side tokenizing
+            if template.context == "html":
+                st.code(preview_text, language="html")
+            else:
+                st.text_area("Preview", preview_text, height=300, disabled=True, label_visibility="collapsed")
         except TemplateRenderError as e:
             st.error(f"**Render Error:** {e}")
         except Exception as e:
@@ -317,7 +453,7 @@ def render_templates_tab():
     # Export handlers
     if export_md and not validation_errors:
         try:
-            preview_text = render_template(template, vars_state)
+            preview_text = _render(template, vars_state)
             fname = f"{to_slug(template.name)}-{int(time.time())}"
             p = export_markdown(preview_text, fname)
             st.success(f"Saved Markdown: {p}")
@@ -326,7 +462,7 @@ def render_templates_tab():
 
     if export_dx and not validation_errors:
         try:
-            preview_text = render_template(template, vars_state)
+            preview_text = _render(template, vars_state)
             fname = f"{to_slug(template.name)}-{int(time.time())}"
             # Use template style if specified
             style_path = template.style if template.style else None
@@ -338,6 +474,8 @@ def render_templates_tab():
     # Run via DJP
     if run_btn and not validation_errors:
         st.markdown("#### DJP Result")
+        # One timestamp per run so the artifact filename and provenance agree
+        ts = int(time.time())
 
         # Corpus upload
         up = st.file_uploader("Optional corpus (.txt/.md/.pdf)", type=["txt", "md", "pdf"], accept_multiple_files=True)
@@ -345,14 +483,22 @@ def render_templates_tab():
         if up and grounded:
             cdir = Path("runs/ui/templates/corpus")
             cdir.mkdir(parents=True, exist_ok=True)
+            # Path -> (name, size, head digest) of the upload last written there, across reruns
+            written = st.session_state.setdefault("_uploaded_hashes", {})
             for f in up:
                 p = cdir / f.name
-                p.write_bytes(f.read())
+                sig = (f.name, f.size, hashlib.blake2b(f.getbuffer()[:65536], digest_size=16).hexdigest())
+                if written.get(str(p)) != sig or not p.exists():
+                    # Chunked copy keeps peak memory at one buffer for multi-MB PDFs
+                    f.seek(0)
+                    with p.open("wb") as dst:
+                        shutil.copyfileobj(f, dst, length=1024 * 1024)
+                    written[str(p)] = sig
                 local_corpus.append(str(p))
 
         try:
             # Render template first
-            draft_text = render_template(template, vars_state)
+            draft_text = _render(template, vars_state)
 
             # Get cost projection
             try:
@@ -427,15 +573,15 @@ def render_templates_tab():
                 rendered_body=draft_text,
                 result=result,
                 cost_projection=cost_projection,
+                timestamp=ts,
             )
 
             # Save artifact with proper naming
             out_dir = Path("runs/ui/templates")
             out_dir.mkdir(parents=True, exist_ok=True)
-            ts = int(time.time())
             fname = f"{ts}-{to_slug(template.key)}-{to_slug(status)}.json"
             fp = out_dir / fname
-            fp.write_text(json.dumps(artifact, indent=2), encoding="utf-8")
+            fp.write_text(ujson.dumps(artifact, indent=2, escape_forward_slashes=False), encoding="utf-8")
             st.success(f"Saved run artifact: {fp}")
 
         except TemplateRenderError as e:
@@ -566,7 +712,9 @@ def render_templates_tab():
                                 }
 
                                 artifact_file = batch_dir / f"{batch_id}-{to_slug(template.key)}-row{i:03d}.json"
-                                artifact_file.write_text(json.dumps(artifact, indent=2), encoding="utf-8")
+                                artifact_file.write_text(
+                                    ujson.dumps(artifact, indent=2, escape_forward_slashes=False), encoding="utf-8"
+                                )
 
                                 successful += 1
                             except Exception as e:
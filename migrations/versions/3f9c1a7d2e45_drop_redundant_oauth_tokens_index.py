@@ -0,0 +1,29 @@
+"""drop redundant oauth_tokens workspace_id index
+
+Revision ID: 3f9c1a7d2e45
+Revises: bb51836389e7
+Create Date: 2026-10-16 09:00:00.000000
+
+- idx_oauth_tokens_workspace_id is a leftmost prefix of
+  idx_oauth_tokens_workspace_provider (workspace_id, provider), so Postgres
+  can serve workspace_id lookups from the composite index
+- Dropping it removes one index write per oauth_tokens INSERT/UPDATE
+"""
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f9c1a7d2e45"
+down_revision: Union[str, None] = "bb51836389e7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index("idx_oauth_tokens_workspace_id", table_name="oauth_tokens")
+
+
+def downgrade() -> None:
+    op.create_index("idx_oauth_tokens_workspace_id", "oauth_tokens", ["workspace_id"])
@@ -0,0 +1,35 @@
+"""add partial index for action_audit error rows
+
+Revision ID: 8a2d4e6b1c93
+Revises: 3f9c1a7d2e45
+Create Date: 2026-10-16 09:30:00.000000
+
+- idx_action_audit_errors: (workspace_id, created_at) WHERE status = 'error'
+- Covers error_reason and http_status so error dashboards can use
+  index-only scans over the small error subset instead of the full audit index
+"""
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8a2d4e6b1c93"
+down_revision: Union[str, None] = "3f9c1a7d2e45"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_action_audit_errors",
+        "action_audit",
+        ["workspace_id", "created_at"],
+        postgresql_where=sa.text("status = 'error'"),
+        postgresql_include=["error_reason", "http_status"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_action_audit_errors", table_name="action_audit")
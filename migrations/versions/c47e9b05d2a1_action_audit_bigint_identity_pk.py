@@ -0,0 +1,39 @@
+"""switch action_audit primary key to bigint identity
+
+Revision ID: c47e9b05d2a1
+Revises: 8a2d4e6b1c93
+Create Date: 2026-10-16 10:00:00.000000
+
+- action_audit is append-only and the highest-volume table; a random UUIDv4
+  primary key scatters every insert across the B-tree
+- id becomes BIGINT GENERATED ALWAYS AS IDENTITY (sequential, hot right-most page)
+- The previous UUID is kept as public_id (unindexed) so GET /audit keeps
+  returning the same opaque ids
+- oauth_tokens keeps its UUID key: it is low volume and written via the
+  uq_oauth_tokens_identity upsert, not by id
+"""
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c47e9b05d2a1"
+down_revision: Union[str, None] = "8a2d4e6b1c93"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_constraint("action_audit_pkey", "action_audit", type_="primary")
+    op.alter_column("action_audit", "id", new_column_name="public_id")
+    op.add_column("action_audit", sa.Column("id", sa.BigInteger(), sa.Identity(always=True), nullable=False))
+    op.create_primary_key("action_audit_pkey", "action_audit", ["id"])
+
+
+def downgrade() -> None:
+    op.drop_constraint("action_audit_pkey", "action_audit", type_="primary")
+    op.drop_column("action_audit", "id")
+    op.alter_column("action_audit", "public_id", new_column_name="id")
+    op.create_primary_key("action_audit_pkey", "action_audit", ["id"])
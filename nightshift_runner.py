@@ -6,9 +6,14 @@
 - Calls your Agents SDK CLI: `python -m src.run_workflow --task ...`.
 - Moves processed tasks into tasks/done/ with a timestamp suffix.
 """
+
 import argparse
+import asyncio
+import functools
+import os
+import queue
 import re
-import subprocess
+import shutil
 import sys
 import time
 from datetime import datetime
@@ -21,8 +26,35 @@
 except Exception:
     pass
 
+try:
+    # optional: kernel file notifications (inotify/FSEvents/ReadDirectoryChangesW) instead of polling
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
 
-def parse_task_file(path: Path) -> dict:
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
+# KEY: VALUE fallback; matches lines like TASK: something
+_KV_RE = re.compile(
+    r"^(TASK|MAX_TOKENS|TEMPERATURE|TRACE_NAME|REQUIRE_CITATIONS|POLICY|FASTPATH|MAX_DEBATERS|TIMEOUT_S|MARGIN_THRESHOLD)\s*:\s*(.+)$",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+# Opening "---" of YAML front matter, after any leading whitespace
+_FM_OPEN_RE = re.compile(r"\s*---")
+
+# One front matter line: key and value with surrounding whitespace and quotes removed
+_FM_LINE_RE = re.compile(r"^\s*([A-Za-z_]+)\s*:\s*['\"]?(.*?)['\"]?\s*$")
+
+# Front matter must close within this many characters of its opening line
+FM_MAX_CHARS = 4096
+
+# Seconds to wait after a file event before processing, so writers can finish the file
+EVENT_SETTLE_S = 1.0
+
+
+def _parse_task(path: Path) -> dict:
     text = path.read_text(encoding="utf-8", errors="ignore")
     data = {
         "task": None,
@@ -38,17 +70,18 @@ def parse_task_file(path: Path) -> dict:
     }
 
     # YAML front matter
-    if text.lstrip().startswith("---"):
+    fm_open = _FM_OPEN_RE.match(text)
+    if fm_open:
         # very light-weight parse to avoid pyyaml dependency
-        fm_end = text.find("\n---", 3)
+        start = fm_open.end()
+        fm_end = text.find("\n---", start, start + FM_MAX_CHARS)
         if fm_end != -1:
-            fm = text[3:fm_end].strip()
-            body = text[fm_end + 4 :]
+            fm = text[start:fm_end].strip()
             for line in fm.splitlines():
-                if ":" in line:
-                    k, v = line.split(":", 1)
-                    key = k.strip().lower()
-                    val = v.strip().strip('"').strip("'")
+                m = _FM_LINE_RE.match(line)
+                if m:
+                    key = m.group(1).lower()
+                    val = m.group(2)
                     if key in ("task", "trace_name", "policy"):
                         data[key] = val
                     elif key in ("max_tokens", "require_citations", "max_debaters", "timeout_s", "margin_threshold"):
@@ -64,108 +97,164 @@ def parse_task_file(path: Path) -> dict:
                     elif key in ("fastpath"):
                         data["fastpath"] = val.lower() in ("true", "1", "yes")
 
-    # KEY: VALUE fallback
-    # Matches lines like TASK: something
-    for m in re.finditer(
-        r"(?im)^(TASK|MAX_TOKENS|TEMPERATURE|TRACE_NAME|REQUIRE_CITATIONS|POLICY|FASTPATH|MAX_DEBATERS|TIMEOUT_S|MARGIN_THRESHOLD)\s*:\s*(.+)$",
-        text,
-    ):
-        key = m.group(1).upper()
-        val = m.group(2).strip()
-        if key == "TASK":
-            data["task"] = val
-        elif key in ("MAX_TOKENS", "REQUIRE_CITATIONS", "MAX_DEBATERS", "TIMEOUT_S", "MARGIN_THRESHOLD"):
-            try:
-                data[key.lower()] = int(val)
-            except:
-                pass
-        elif key == "TEMPERATURE":
-            try:
-                data["temperature"] = float(val)
-            except:
-                pass
-        elif key in ("TRACE_NAME", "POLICY"):
-            data[key.lower()] = val
-        elif key == "FASTPATH":
-            data["fastpath"] = val.lower() in ("true", "1", "yes")
+    # KEY: VALUE fallback, only needed when front matter didn't already supply the task
+    if not data["task"]:
+        for m in _KV_RE.finditer(text):
+            key = m.group(1).upper()
+            val = m.group(2).strip()
+            if key == "TASK":
+                data["task"] = val
+            elif key in ("MAX_TOKENS", "REQUIRE_CITATIONS", "MAX_DEBATERS", "TIMEOUT_S", "MARGIN_THRESHOLD"):
+                try:
+                    data[key.lower()] = int(val)
+                except:
+                    pass
+            elif key == "TEMPERATURE":
+                try:
+                    data["temperature"] = float(val)
+                except:
+                    pass
+            elif key in ("TRACE_NAME", "POLICY"):
+                data[key.lower()] = val
+            elif key == "FASTPATH":
+                data["fastpath"] = val.lower() in ("true", "1", "yes")
 
     return data
 
 
-def run_once(repo: Path, tasks_dir: Path) -> int:
-    tasks = sorted(tasks_dir.glob("*.task.md"))
-    if not tasks:
+@functools.lru_cache(maxsize=2048)
+def _parse_cached(path_str: str, mtime_ns: int, size: int) -> dict:
+    # mtime_ns and size only key the cache, so an edited file is parsed again
+    return _parse_task(Path(path_str))
+
+
+def parse_task_file(path: Path) -> dict:
+    st = path.stat()
+    return dict(_parse_cached(str(path), st.st_mtime_ns, st.st_size))
+
+
+async def process_task(task_file: Path, repo: Path, done_dir: Path, ts: str) -> bool:
+    """Run one task file and move it into done_dir, stamped with the batch timestamp `ts`.
+
+    Returns False if the task was invalid.
+    """
+    spec = parse_task_file(task_file)
+    if not spec.get("task"):
+        # Move invalid to done with note
+        task_file.rename(done_dir / f"{task_file.stem}.{ts}.invalid.md")
+        return False
+
+    cmd = [
+        sys.executable,
+        "-m",
+        "src.run_workflow",
+        "--task",
+        spec["task"],
+        "--max_tokens",
+        str(spec.get("max_tokens", 1200)),
+        "--temperature",
+        str(spec.get("temperature", 0.3)),
+        "--trace_name",
+        spec.get("trace_name", "nightshift"),
+        # Optional parameters, only when specified
+        *(["--require_citations", str(spec["require_citations"])] if spec.get("require_citations", 0) > 0 else []),
+        *(["--policy", spec["policy"]] if spec.get("policy") and spec["policy"] != "openai_only" else []),
+        *(["--fastpath"] if spec.get("fastpath") else []),
+        *(["--max_debaters", str(spec["max_debaters"])] if spec.get("max_debaters") else []),
+        *(["--timeout_s", str(spec["timeout_s"])] if spec.get("timeout_s") else []),
+        *(["--margin_threshold", str(spec["margin_threshold"])] if spec.get("margin_threshold") else []),
+    ]
+    print("[NightShift] Running:", *cmd, "in", repo)
+    proc = await asyncio.create_subprocess_exec(*cmd, cwd=str(repo))
+    returncode = await proc.wait()
+    if returncode == 0:
+        status = "ok"
+    else:
+        print(f"[NightShift] ERROR: {task_file.name} exited with status {returncode}")
+        status = "error"
+
+    # shutil.move renames in place, or falls back to a binary copy+remove across volumes
+    shutil.move(task_file, done_dir / f"{task_file.stem}.{ts}.{status}.md")
+    return True
+
+
+async def run_once_async(repo: Path, tasks_dir: Path) -> int:
+    """Run pending tasks oldest-first on NIGHTSHIFT_CONCURRENCY (default 4) workers."""
+    with os.scandir(tasks_dir) as it:
+        entries = [e for e in it if e.name.endswith(".task.md") and e.is_file()]
+    if not entries:
         return 0
+    # FIFO by mtime; DirEntry caches its stat, and the name breaks ties deterministically
+    entries.sort(key=lambda e: (e.stat().st_mtime_ns, e.name))
     done_dir = tasks_dir / "done"
     done_dir.mkdir(exist_ok=True, parents=True)
 
-    processed = 0
-    for task_file in tasks:
-        spec = parse_task_file(task_file)
-        if not spec.get("task"):
-            # Move invalid to done with note
-            ts = datetime.now().strftime("%Y.%m.%d-%H%M%S")
-            task_file.rename(done_dir / f"{task_file.stem}.{ts}.invalid.md")
-            continue
-
-        cmd = [
-            sys.executable,
-            "-m",
-            "src.run_workflow",
-            "--task",
-            spec["task"],
-            "--max_tokens",
-            str(spec.get("max_tokens", 1200)),
-            "--temperature",
-            str(spec.get("temperature", 0.3)),
-            "--trace_name",
-            spec.get("trace_name", "nightshift"),
-        ]
-
-        # Add optional parameters if specified
-        if spec.get("require_citations", 0) > 0:
-            cmd.extend(["--require_citations", str(spec["require_citations"])])
-
-        if spec.get("policy") and spec["policy"] != "openai_only":
-            cmd.extend(["--policy", spec["policy"]])
-
-        if spec.get("fastpath"):
-            cmd.append("--fastpath")
-
-        if spec.get("max_debaters"):
-            cmd.extend(["--max_debaters", str(spec["max_debaters"])])
-
-        if spec.get("timeout_s"):
-            cmd.extend(["--timeout_s", str(spec["timeout_s"])])
-
-        if spec.get("margin_threshold"):
-            cmd.extend(["--margin_threshold", str(spec["margin_threshold"])])
-        print(f"[NightShift] Running: {' '.join(cmd)} in {repo}")
-        try:
-            subprocess.run(cmd, cwd=str(repo), check=True)
-            status = "ok"
-        except subprocess.CalledProcessError as e:
-            print(f"[NightShift] ERROR: {e}")
-            status = "error"
-
-        ts = datetime.now().strftime("%Y.%m.%d-%H%M%S")
-        dest = done_dir / f"{task_file.stem}.{ts}.{status}.md"
-        try:
-            task_file.rename(dest)
-        except Exception:
-            # if rename fails across volumes, copy+remove
-            dest.write_text(task_file.read_text(encoding="utf-8", errors="ignore"), encoding="utf-8")
-            task_file.unlink(missing_ok=True)
-
-        processed += 1
-    return processed
+    # One timestamp per batch; file stems already keep the done/ names unique
+    batch_ts = datetime.now().strftime("%Y.%m.%d-%H%M%S")
+    pending: asyncio.Queue = asyncio.Queue()
+    for entry in entries:
+        pending.put_nowait(entry.path)
+
+    async def _worker() -> int:
+        processed = 0
+        while not pending.empty():
+            task_file = Path(pending.get_nowait())
+            processed += await process_task(task_file, repo, done_dir, batch_ts)
+        return processed
+
+    workers = min(len(entries), max(1, int(os.getenv("NIGHTSHIFT_CONCURRENCY", "4"))))
+    results = await asyncio.gather(*(_worker() for _ in range(workers)))
+    return sum(results)
+
+
+def run_once(repo: Path, tasks_dir: Path) -> int:
+    return asyncio.run(run_once_async(repo, tasks_dir))
+
+
+def watch_events(repo: Path, tasks_dir: Path, interval: int) -> None:
+    """Process tasks as soon as they appear, with a full rescan every `interval` seconds as a safety net."""
+    events: queue.Queue = queue.Queue()
+
+    class _TaskHandler(FileSystemEventHandler):
+        def on_created(self, event):
+            if not event.is_directory and event.src_path.endswith(".task.md"):
+                events.put(event.src_path)
+
+        def on_moved(self, event):
+            if not event.is_directory and event.dest_path.endswith(".task.md"):
+                events.put(event.dest_path)
+
+    observer = Observer()
+    observer.schedule(_TaskHandler(), str(tasks_dir), recursive=False)
+    observer.start()
+    print(f"[NightShift] Watching {tasks_dir} for new tasks (rescan every {interval}s)...")
+    try:
+        run_once(repo, tasks_dir)
+        while True:
+            try:
+                events.get(timeout=interval)
+                time.sleep(EVENT_SETTLE_S)
+                # Drain the burst; run_once picks up every pending file in order
+                while not events.empty():
+                    events.get_nowait()
+            except queue.Empty:
+                pass
+            run_once(repo, tasks_dir)
+    finally:
+        observer.stop()
+        observer.join()
 
 
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("--repo", required=True, help="Path to the repo containing src/run_workflow.py")
     ap.add_argument("--tasks-dir", required=True, help="Folder with *.task.md files")
-    ap.add_argument("--interval", type=int, default=60, help="Polling interval in seconds (0 = process once and exit)")
+    ap.add_argument(
+        "--interval",
+        type=int,
+        default=60,
+        help="Polling interval in seconds, or rescan interval when watchdog is installed (0 = process once and exit)",
+    )
     ap.add_argument("--oneshot", action="store_true", help="Process existing tasks and exit")
     args = ap.parse_args()
 
@@ -176,6 +265,10 @@ def main():
         run_once(repo, tasks_dir)
         return
 
+    if WATCHDOG_AVAILABLE:
+        watch_events(repo, tasks_dir, args.interval)
+        return
+
     print(f"[NightShift] Watching {tasks_dir} every {args.interval}s...")
     while True:
         run_once(repo, tasks_dir)
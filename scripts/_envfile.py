@@ -0,0 +1,14 @@
+"""Minimal .env file loader shared by the E2E runner scripts."""
+
+from pathlib import Path
+
+
+def load_env(path: Path) -> dict[str, str]:
+    """Parse KEY=VALUE lines from an env file, skipping blanks and # comments."""
+    env = {}
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if line and not line.startswith("#") and "=" in line:
+            key, value = line.split("=", 1)
+            env[key.strip()] = value.strip()
+    return env
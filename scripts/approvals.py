@@ -11,47 +11,52 @@
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.orchestrator.checkpoints import (  # noqa: E402
-    add_signature,
-    approve_checkpoint,
-    get_checkpoint,
-    is_satisfied,
-    list_checkpoints,
-    reject_checkpoint,
-)
-from src.security.rbac_check import can_approve  # noqa: E402
-
-
-def list_command(tenant: str | None = None) -> int:
+# Checkpoint and RBAC modules are imported inside each command so --help stays cheap
+
+
+def list_command(tenant: str | None = None, limit: int | None = 100) -> int:
     """
     List pending checkpoints.
 
     Args:
         tenant: Filter by tenant (None for all)
+        limit: Show at most this many, most recent first (None for all)
 
     Returns:
         Exit code
     """
-    checkpoints = list_checkpoints(tenant=tenant, status="pending")
+    from src.orchestrator.checkpoints import list_checkpoints
+
+    # Ask for one extra row to learn whether the list was truncated
+    checkpoints = list_checkpoints(tenant=tenant, status="pending", limit=None if limit is None else limit + 1)
+    truncated = limit is not None and len(checkpoints) > limit
+    if truncated:
+        checkpoints = checkpoints[:limit]
 
     if not checkpoints:
         print("No pending checkpoints.")
         return 0
 
-    print(f"{'Checkpoint ID':<40} {'Task':<20} {'DAG Run ID':<40} {'Prompt':<50} {'Role':<15} {'Created':<20}")
-    print("=" * 195)
-
-    for cp in checkpoints:
-        print(
-            f"{cp['checkpoint_id']:<40} "
-            f"{cp['task_id']:<20} "
-            f"{cp['dag_run_id']:<40} "
-            f"{cp['prompt'][:47]:<50} "
-            f"{cp['required_role']:<15} "
-            f"{cp['created_at'][:19]:<20}"
-        )
+    lines = [
+        f"{'Checkpoint ID':<40} {'Task':<20} {'DAG Run ID':<40} {'Prompt':<50} {'Role':<15} {'Created':<20}",
+        "=" * 195,
+    ]
+    lines.extend(
+        f"{cp['checkpoint_id']:<40} "
+        f"{cp['task_id']:<20} "
+        f"{cp['dag_run_id']:<40} "
+        f"{cp['prompt'][:47]:<50} "
+        f"{cp['required_role']:<15} "
+        f"{cp['created_at'][:19]:<20}"
+        for cp in checkpoints
+    )
+    if truncated:
+        lines.append(f"\n(showing first {limit}; pass --limit 0 to list all)\n")
+    else:
+        lines.append(f"\nTotal: {len(checkpoints)} pending checkpoint(s)\n")
 
-    print(f"\nTotal: {len(checkpoints)} pending checkpoint(s)")
+    # One write for the whole table instead of a print per row
+    sys.stdout.write("\n".join(lines))
 
     return 0
 
@@ -67,6 +72,9 @@ def approve_command(checkpoint_id: str, kv: dict[str, str] | None = None) -> int
     Returns:
         Exit code
     """
+    from src.orchestrator.checkpoints import approve_checkpoint, get_checkpoint
+    from src.security.rbac_check import can_approve
+
     # Get user role from env
     user_role = os.getenv("USER_RBAC_ROLE", "Viewer")
 
@@ -121,6 +129,9 @@ def reject_command(checkpoint_id: str, reason: str) -> int:
     Returns:
         Exit code
     """
+    from src.orchestrator.checkpoints import get_checkpoint, reject_checkpoint
+    from src.security.rbac_check import can_approve
+
     # Get user role from env
     user_role = os.getenv("USER_RBAC_ROLE", "Viewer")
 
@@ -171,6 +182,8 @@ def sign_command(checkpoint_id: str, user: str, kv: dict[str, str] | None = None
     Returns:
         Exit code
     """
+    from src.orchestrator.checkpoints import add_signature, get_checkpoint, is_satisfied
+
     checkpoint = get_checkpoint(checkpoint_id)
 
     if not checkpoint:
@@ -220,6 +233,8 @@ def status_command(checkpoint_id: str) -> int:
     Returns:
         Exit code
     """
+    from src.orchestrator.checkpoints import get_checkpoint, is_satisfied
+
     checkpoint = get_checkpoint(checkpoint_id)
 
     if not checkpoint:
@@ -268,6 +283,17 @@ def status_command(checkpoint_id: str) -> int:
     return 0
 
 
+def _non_negative_int(value: str) -> int:
+    """argparse type for counts where 0 is meaningful but negatives are not."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected an integer, got {value!r}") from None
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be >= 0, got {number}")
+    return number
+
+
 def main() -> int:
     """CLI entrypoint."""
     parser = argparse.ArgumentParser(description="Manage checkpoint approvals")
@@ -277,6 +303,9 @@ def main() -> int:
     # List command
     list_parser = subparsers.add_parser("list", help="List pending checkpoints")
     list_parser.add_argument("--tenant", help="Filter by tenant")
+    list_parser.add_argument(
+        "--limit", type=_non_negative_int, default=100, help="Maximum checkpoints to show (0 = all)"
+    )
 
     # Approve command
     approve_parser = subparsers.add_parser("approve", help="Approve a checkpoint")
@@ -313,7 +342,7 @@ def main() -> int:
         return 1
 
     if args.command == "list":
-        return list_command(tenant=args.tenant)
+        return list_command(tenant=args.tenant, limit=args.limit or None)
 
     elif args.command == "approve":
         # Parse key-value pairs
@@ -31,6 +31,8 @@
 """
 
 import argparse
+import asyncio
+import functools
 import os
 import sys
 from datetime import UTC, datetime
@@ -39,9 +41,10 @@
 # Add src to Python path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from security.audit import AuditAction, get_audit_logger  # noqa: E402
-from security.teams import get_team_role, upsert_team_member  # noqa: E402
-from security.workspaces import get_workspace_role, upsert_workspace_member  # noqa: E402
+# security.* modules are imported where they are used so --help and --dry-run skip them
+
+# Marks a role probe that run() has not done up front
+_NOT_PROBED = object()
 
 
 class BootstrapError(Exception):
@@ -65,7 +68,6 @@ def __init__(self, admin_user: str, tenant: str, verbose: bool = True):
         self.admin_user = admin_user
         self.tenant = tenant
         self.verbose = verbose
-        self.audit_logger = get_audit_logger()
 
         # Default IDs
         self.default_team_id = f"team-{tenant}-default"
@@ -73,6 +75,16 @@ def __init__(self, admin_user: str, tenant: str, verbose: bool = True):
         self.default_workspace_id = f"ws-{tenant}-default"
         self.default_workspace_name = f"{tenant} Default Workspace"
 
+        # Admin's team role once create_admin_user has confirmed or written it
+        self._team_role: str | None = None
+
+    @functools.cached_property
+    def audit_logger(self):
+        """Process-wide audit logger, fetched on first use so --dry-run never touches the audit dir."""
+        from security.audit import get_audit_logger
+
+        return get_audit_logger()
+
     def log(self, message: str) -> None:
         """Print status message if verbose."""
         if self.verbose:
@@ -113,27 +125,35 @@ def validate_config(self) -> None:
 
         self.log(f"Configuration validated: user={self.admin_user}, tenant={self.tenant}")
 
-    def create_admin_user(self) -> bool:
+    def create_admin_user(self, existing_role=_NOT_PROBED) -> bool:
         """
         Create or update admin user with Admin role in default team.
 
+        Args:
+            existing_role: Admin's current team role if already probed (looked up when omitted)
+
         Returns:
             True if user was created, False if already existed
 
         Raises:
             BootstrapError: If creation fails
         """
+        from security.audit import AuditAction
+        from security.teams import get_team_role, upsert_team_member
+
         try:
             self.log(f"Creating admin user '{self.admin_user}' in team '{self.default_team_id}'...")
 
             # Check if user already exists in team
-            existing_role = get_team_role(self.admin_user, self.default_team_id)
+            if existing_role is _NOT_PROBED:
+                existing_role = get_team_role(self.admin_user, self.default_team_id)
             was_existing = existing_role is not None
 
             if was_existing:
                 self.log(f"User already exists with role: {existing_role}")
                 if existing_role == "Admin":
                     self.log("User already has Admin role, skipping creation")
+                    self._team_role = existing_role
                     return False
                 else:
                     self.log(f"Upgrading user role from {existing_role} to Admin")
@@ -145,6 +165,7 @@ def create_admin_user(self) -> bool:
                 role="Admin",
                 team_name=self.default_team_name,
             )
+            self._team_role = "Admin"
 
             # Log audit event
             self.audit_logger.log_success(
@@ -193,11 +214,13 @@ def create_default_team(self) -> bool:
             Team creation is handled automatically by upsert_team_member
             in create_admin_user(), so this verifies the team exists.
         """
+        from security.teams import get_team_role
+
         try:
             self.log(f"Verifying default team '{self.default_team_id}'...")
 
-            # Check if admin is in team (implies team exists)
-            existing_role = get_team_role(self.admin_user, self.default_team_id)
+            # Check if admin is in team (implies team exists); reuse what create_admin_user just established
+            existing_role = self._team_role or get_team_role(self.admin_user, self.default_team_id)
 
             if existing_role:
                 self.log_success(f"Default team exists with admin as {existing_role}")
@@ -211,21 +234,28 @@ def create_default_team(self) -> bool:
             self.log_error(f"Failed to verify default team: {e}")
             raise BootstrapError(f"Failed to verify default team: {e}") from e
 
-    def create_default_workspace(self) -> bool:
+    def create_default_workspace(self, existing_role=_NOT_PROBED) -> bool:
         """
         Create initial workspace for the default team.
 
+        Args:
+            existing_role: Admin's current workspace role if already probed (looked up when omitted)
+
         Returns:
             True if workspace was created, False if already existed
 
         Raises:
             BootstrapError: If creation fails
         """
+        from security.audit import AuditAction
+        from security.workspaces import get_workspace_role, upsert_workspace_member
+
         try:
             self.log(f"Creating default workspace '{self.default_workspace_id}'...")
 
             # Check if workspace already exists
-            existing_role = get_workspace_role(self.admin_user, self.default_workspace_id)
+            if existing_role is _NOT_PROBED:
+                existing_role = get_workspace_role(self.admin_user, self.default_workspace_id)
             was_existing = existing_role is not None
 
             if was_existing:
@@ -282,6 +312,21 @@ def create_default_workspace(self) -> bool:
             )
             raise BootstrapError(f"Failed to create default workspace: {e}") from e
 
+    async def probe_existing_roles(self) -> tuple[str | None, str | None]:
+        """
+        Look up the admin's current team and workspace roles concurrently.
+
+        Returns:
+            Tuple of (team role, workspace role), None where the admin is not a member
+        """
+        from security.teams import get_team_role
+        from security.workspaces import get_workspace_role
+
+        return await asyncio.gather(
+            asyncio.to_thread(get_team_role, self.admin_user, self.default_team_id),
+            asyncio.to_thread(get_workspace_role, self.admin_user, self.default_workspace_id),
+        )
+
     def run(self) -> dict:
         """
         Run the complete bootstrap process.
@@ -302,14 +347,17 @@ def run(self) -> dict:
             # Validate configuration
             self.validate_config()
 
+            # Both idempotency probes scan independent JSONL files, so overlap them
+            team_role, workspace_role = asyncio.run(self.probe_existing_roles())
+
             # Create admin user and team
-            user_created = self.create_admin_user()
+            user_created = self.create_admin_user(team_role)
 
             # Verify team (created implicitly)
             self.create_default_team()
 
             # Create default workspace
-            workspace_created = self.create_default_workspace()
+            workspace_created = self.create_default_workspace(workspace_role)
 
             # Calculate duration
             duration = (datetime.now(UTC) - start_time).total_seconds()
@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 """Automated Postgres backup script.
 
-Creates compressed pg_dump backups and stores them with 30-day retention.
+Creates compressed, parallel pg_dump backups (directory format) and stores them
+with 30-day retention. Restore with pg_restore, see scripts/db_restore_check.py.
 
 Usage:
     python scripts/db_backup.py --output-dir /backups
@@ -11,8 +12,8 @@
 """
 
 import argparse
-import gzip
 import os
+import shutil
 import subprocess
 import sys
 from datetime import datetime, timedelta
@@ -28,39 +29,52 @@ def get_database_url():
     return db_url
 
 
-def create_backup(output_dir: Path, database_url: str) -> Path:
+def create_backup(output_dir: Path, database_url: str, jobs: int = 4) -> Path:
     """Create compressed pg_dump backup.
 
+    Uses pg_dump's directory format so tables are dumped by `jobs` parallel
+    workers and compressed by pg_dump itself.
+
     Args:
         output_dir: Directory to store backup
         database_url: Postgres connection string
+        jobs: Number of parallel pg_dump workers
 
     Returns:
-        Path to created backup file
+        Path to created backup directory
     """
+    # One clock read so the date directory and file timestamp can't straddle midnight
+    now = datetime.utcnow()
+
     # Create output directory with date
-    date_str = datetime.utcnow().strftime("%Y-%m-%d")
+    date_str = now.strftime("%Y-%m-%d")
     backup_dir = output_dir / date_str
     backup_dir.mkdir(parents=True, exist_ok=True)
 
-    # Backup filename with timestamp
-    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-    backup_file = backup_dir / f"relay_backup_{timestamp}.sql.gz"
+    # Backup directory name with timestamp
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
+    backup_path = backup_dir / f"relay_backup_{timestamp}.d"
 
-    print(f"[INFO] Creating backup: {backup_file}")
+    print(f"[INFO] Creating backup: {backup_path}")
 
     # Run pg_dump with compression
     try:
-        # Use pg_dump with --clean --if-exists for schema+data
-        dump_cmd = ["pg_dump", "--clean", "--if-exists", "--no-owner", "--no-acl", database_url]
-
-        with gzip.open(backup_file, "wb") as f:
-            subprocess.run(dump_cmd, stdout=f, check=True, stderr=subprocess.PIPE)
-
-        file_size_mb = backup_file.stat().st_size / (1024 * 1024)
-        print(f"[INFO] Backup created: {backup_file} ({file_size_mb:.2f} MB)")
-
-        return backup_file
+        # --clean/--if-exists/--no-owner/--no-acl are applied by pg_restore for archive formats
+        dump_cmd = [
+            "pg_dump",
+            "--format=directory",
+            f"--jobs={jobs}",
+            "--compress=6",
+            "--file",
+            str(backup_path),
+            database_url,
+        ]
+        subprocess.run(dump_cmd, check=True, stderr=subprocess.PIPE)
+
+        size_bytes = sum(f.stat().st_size for f in backup_path.iterdir())
+        print(f"[INFO] Backup created: {backup_path} ({size_bytes / (1024 * 1024):.2f} MB)")
+
+        return backup_path
 
     except subprocess.CalledProcessError as e:
         print(f"[ERROR] pg_dump failed: {e.stderr.decode()}")
@@ -83,18 +97,17 @@ def cleanup_old_backups(output_dir: Path, retention_days: int = 30):
     print(f"[INFO] Cleaning up backups older than {cutoff_str}")
 
     removed_count = 0
-    for backup_date_dir in output_dir.iterdir():
-        if not backup_date_dir.is_dir():
-            continue
+    # scandir's DirEntry.is_dir() uses the type from readdir, so no stat per entry
+    with os.scandir(output_dir) as it:
+        date_dirs = [entry for entry in it if entry.is_dir()]
 
+    for entry in date_dirs:
         # Check if directory name is a date string older than cutoff
         try:
-            dir_date = datetime.strptime(backup_date_dir.name, "%Y-%m-%d")
+            dir_date = datetime.strptime(entry.name, "%Y-%m-%d")
             if dir_date < cutoff_date:
-                print(f"[INFO] Removing old backup: {backup_date_dir}")
-                for backup_file in backup_date_dir.iterdir():
-                    backup_file.unlink()
-                backup_date_dir.rmdir()
+                print(f"[INFO] Removing old backup: {entry.path}")
+                shutil.rmtree(entry.path)
                 removed_count += 1
         except ValueError:
             # Not a date directory, skip
@@ -116,13 +129,19 @@ def main():
         default=30,
         help="Number of days to retain backups (default: 30)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=4,
+        help="Parallel pg_dump workers (default: 4)",
+    )
     args = parser.parse_args()
 
     output_dir = Path(args.output_dir)
     database_url = get_database_url()
 
     # Create backup
-    backup_file = create_backup(output_dir, database_url)
+    backup_file = create_backup(output_dir, database_url, args.jobs)
 
     # Cleanup old backups
     cleanup_old_backups(output_dir, args.retention_days)
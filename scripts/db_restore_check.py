@@ -13,10 +13,13 @@
 import argparse
 import gzip
 import os
+import shutil
 import subprocess
 import sys
+import tempfile
 from datetime import datetime
 from pathlib import Path
+from urllib.parse import ParseResult, urlparse, urlunparse
 
 import psycopg2
 from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
@@ -40,29 +43,31 @@ def find_latest_backup(backup_dir: Path) -> Path:
     Returns:
         Path to latest backup file
     """
-    backup_files = []
-
-    for date_dir in sorted(backup_dir.iterdir(), reverse=True):
-        if not date_dir.is_dir():
-            continue
-
-        for backup_file in sorted(date_dir.glob("*.sql.gz"), reverse=True):
-            backup_files.append(backup_file)
+    # relay_backup_<timestamp>.d (pg_dump directory format) or legacy .sql.gz dumps.
+    # Names embed the UTC timestamp, so the newest is the max name; no stat or sort needed.
+    candidates = (
+        backup_file
+        for date_dir in backup_dir.iterdir()
+        if date_dir.is_dir()
+        for pattern in ("relay_backup_*.d", "*.sql.gz")
+        for backup_file in date_dir.glob(pattern)
+    )
+    latest = max(candidates, key=lambda p: p.name, default=None)
 
-    if not backup_files:
+    if latest is None:
         print(f"ERROR: No backups found in {backup_dir}")
         sys.exit(1)
 
-    latest = backup_files[0]
     print(f"[INFO] Latest backup: {latest}")
     return latest
 
 
-def create_ephemeral_database(admin_url: str, db_name: str) -> str:
+def create_ephemeral_database(admin_db_url: str, parsed: ParseResult, db_name: str) -> str:
     """Create ephemeral test database.
 
     Args:
-        admin_url: Admin postgres connection string
+        admin_db_url: Connection string for the server's postgres database
+        parsed: Parsed admin connection string, used to build the ephemeral URL
         db_name: Name for ephemeral database
 
     Returns:
@@ -70,12 +75,6 @@ def create_ephemeral_database(admin_url: str, db_name: str) -> str:
     """
     print(f"[INFO] Creating ephemeral database: {db_name}")
 
-    # Parse admin URL and replace database name
-    from urllib.parse import urlparse, urlunparse
-
-    parsed = urlparse(admin_url)
-    admin_db_url = urlunparse(parsed._replace(path="/postgres"))
-
     try:
         conn = psycopg2.connect(admin_db_url)
         conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
@@ -100,20 +99,57 @@ def create_ephemeral_database(admin_url: str, db_name: str) -> str:
         sys.exit(1)
 
 
-def restore_backup(backup_file: Path, target_url: str):
+def restore_backup(backup_file: Path, target_url: str, jobs: int = 4):
     """Restore backup to target database.
 
     Args:
-        backup_file: Path to compressed backup file
+        backup_file: Path to a directory-format backup, or a legacy .sql.gz file
         target_url: Target database connection string
+        jobs: Parallel pg_restore workers for directory-format backups
     """
     print("[INFO] Restoring backup to ephemeral database...")
 
+    if backup_file.is_dir():
+        try:
+            restore_cmd = [
+                "pg_restore",
+                f"--jobs={jobs}",
+                "--no-owner",
+                "--no-acl",
+                "--dbname",
+                target_url,
+                str(backup_file),
+            ]
+            subprocess.run(restore_cmd, check=True, stderr=subprocess.PIPE)
+            print("[INFO] Backup restored successfully")
+        except subprocess.CalledProcessError as e:
+            print(f"[ERROR] Restore failed: {e.stderr.decode()}")
+            sys.exit(1)
+        return
+
     try:
-        # Decompress and restore
-        with gzip.open(backup_file, "rb") as f:
-            restore_cmd = ["psql", "--quiet", target_url]
-            subprocess.run(restore_cmd, stdin=f, check=True, stderr=subprocess.PIPE)
+        # Decompress in a gunzip/pigz process piped straight into psql
+        restore_cmd = ["psql", "--quiet", target_url]
+        decompressor = shutil.which("pigz") or shutil.which("gzip")
+        with tempfile.TemporaryFile() as err:
+            if decompressor:
+                unzip = subprocess.Popen([decompressor, "-dc", str(backup_file)], stdout=subprocess.PIPE, stderr=err)
+                psql = subprocess.Popen(restore_cmd, stdin=unzip.stdout, stderr=err)
+                unzip.stdout.close()  # so gunzip sees SIGPIPE if psql exits
+                unzip_rc = unzip.wait()
+            else:
+                psql = subprocess.Popen(restore_cmd, stdin=subprocess.PIPE, stderr=err)
+                with gzip.open(backup_file, "rb") as f:
+                    shutil.copyfileobj(f, psql.stdin, 1024 * 1024)
+                psql.stdin.close()
+                unzip_rc = 0
+
+            if psql.wait() != 0:
+                err.seek(0)
+                raise subprocess.CalledProcessError(psql.returncode, restore_cmd, stderr=err.read())
+            if unzip_rc != 0:
+                err.seek(0)
+                raise subprocess.CalledProcessError(unzip_rc, decompressor, stderr=err.read())
 
         print("[INFO] Backup restored successfully")
 
@@ -139,45 +175,46 @@ def run_sanity_checks(target_url: str) -> dict:
 
         results = {}
 
-        # Check 1: Count tables
+        # One round-trip for everything: existence via to_regclass, and row counts via
+        # query_to_xml so a missing table yields NULL instead of aborting the query
+        expected_tables = ["workspaces", "api_keys", "audit_logs", "sessions"]
         cursor.execute(
             """
-            SELECT COUNT(*)
-            FROM information_schema.tables
-            WHERE table_schema = 'public'
-        """
+            SELECT
+                t.name,
+                to_regclass('public.' || quote_ident(t.name)) IS NOT NULL AS present,
+                CASE WHEN to_regclass('public.' || quote_ident(t.name)) IS NOT NULL THEN
+                    (xpath(
+                        '/row/n/text()',
+                        query_to_xml(format('SELECT count(*) AS n FROM public.%%I', t.name), false, true, '')
+                    ))[1]::text::bigint
+                END AS row_count,
+                (SELECT COUNT(*) FROM information_schema.tables WHERE table_schema = 'public') AS table_count
+            FROM unnest(%s::text[]) WITH ORDINALITY AS t(name, ord)
+            ORDER BY t.ord
+        """,
+            (expected_tables,),
         )
-        table_count = cursor.fetchone()[0]
+        rows = cursor.fetchall()
+
+        # Check 1: Count tables
+        table_count = rows[0][3]
         results["table_count"] = table_count
         print(f"  - Tables: {table_count}")
 
         # Check 2: Check key tables exist
-        expected_tables = ["workspaces", "api_keys", "audit_logs", "sessions"]
-        for table_name in expected_tables:
-            cursor.execute(
-                """
-                SELECT EXISTS (
-                    SELECT 1
-                    FROM information_schema.tables
-                    WHERE table_schema = 'public' AND table_name = %s
-                )
-            """,
-                (table_name,),
-            )
-            exists = cursor.fetchone()[0]
+        for table_name, exists, _, _ in rows:
             results[f"table_{table_name}"] = exists
             status = "✓" if exists else "✗"
             print(f"  - Table '{table_name}': {status}")
 
         # Check 3: Row counts for key tables
-        for table_name in expected_tables:
-            try:
-                cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
-                row_count = cursor.fetchone()[0]
-                results[f"rows_{table_name}"] = row_count
-                print(f"  - Rows in '{table_name}': {row_count}")
-            except Exception as e:
-                print(f"  - Warning: Could not count rows in '{table_name}': {e}")
+        for table_name, _, row_count, _ in rows:
+            if row_count is None:
+                print(f"  - Warning: Could not count rows in '{table_name}': table does not exist")
+                continue
+            results[f"rows_{table_name}"] = row_count
+            print(f"  - Rows in '{table_name}': {row_count}")
 
         cursor.close()
         conn.close()
@@ -190,20 +227,15 @@ def run_sanity_checks(target_url: str) -> dict:
         sys.exit(1)
 
 
-def cleanup_ephemeral_database(admin_url: str, db_name: str):
+def cleanup_ephemeral_database(admin_db_url: str, db_name: str):
     """Drop ephemeral test database.
 
     Args:
-        admin_url: Admin postgres connection string
+        admin_db_url: Connection string for the server's postgres database
         db_name: Name of ephemeral database
     """
     print(f"[INFO] Cleaning up ephemeral database: {db_name}")
 
-    from urllib.parse import urlparse, urlunparse
-
-    parsed = urlparse(admin_url)
-    admin_db_url = urlunparse(parsed._replace(path="/postgres"))
-
     try:
         conn = psycopg2.connect(admin_db_url)
         conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
@@ -264,12 +296,16 @@ def main():
     backup_dir = Path(args.backup_dir)
     admin_url = get_database_url()
 
+    # Parse admin URL once; admin operations run against the postgres database
+    parsed = urlparse(admin_url)
+    admin_db_url = urlunparse(parsed._replace(path="/postgres"))
+
     # Find latest backup
     backup_file = find_latest_backup(backup_dir)
 
     # Create ephemeral database
     ephemeral_db_name = f"restore_drill_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}"
-    ephemeral_url = create_ephemeral_database(admin_url, ephemeral_db_name)
+    ephemeral_url = create_ephemeral_database(admin_db_url, parsed, ephemeral_db_name)
 
     start_time = datetime.utcnow()
 
@@ -289,7 +325,7 @@ def main():
 
     finally:
         # Always cleanup ephemeral database
-        cleanup_ephemeral_database(admin_url, ephemeral_db_name)
+        cleanup_ephemeral_database(admin_db_url, ephemeral_db_name)
 
 
 if __name__ == "__main__":
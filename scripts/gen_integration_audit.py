@@ -5,9 +5,10 @@
 integration documentation drift. It checks for the existence and
 recent changes to integration-critical files.
 """
+import functools
+import os
 import subprocess
 from datetime import datetime
-from pathlib import Path
 
 # Paths to monitor for integration changes
 INTEGRATION_PATHS = [
@@ -30,23 +31,45 @@
 
 def get_last_commit_info(path: str) -> str:
     """Get last commit info for a path using git."""
+    return get_last_commit_infos([path])[path]
+
+
+def get_last_commit_infos(paths: list[str]) -> dict[str, str]:
+    """Get last commit info for every path from a single git log walk."""
+    infos: dict[str, str] = {}
     try:
-        result = subprocess.run(
-            ["git", "log", "-1", "--format=%h %ai", "--", path],
-            capture_output=True,
+        proc = subprocess.Popen(
+            ["git", "log", "--format=%x00%h %ai", "--name-only", "--", *paths],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
-            check=False,
         )
-        if result.returncode == 0 and result.stdout.strip():
-            return result.stdout.strip()
-        return "(no commits)"
     except Exception:
-        return "(git unavailable)"
-
-
+        return dict.fromkeys(paths, "(git unavailable)")
+
+    with proc:
+        commit = ""
+        # Newest first: "\0<hash> <date>" header, then the files that commit touched
+        for line in proc.stdout:
+            line = line.rstrip("\n")
+            if line.startswith("\0"):
+                commit = line[1:]
+            elif line:
+                for path in paths:
+                    if path not in infos and (line == path or line.startswith(path + "/")):
+                        infos[path] = commit
+                if len(infos) == len(paths):
+                    # Every path resolved; no need to walk older history
+                    proc.kill()
+                    break
+
+    return {path: infos.get(path, "(no commits)") for path in paths}
+
+
+@functools.cache
 def path_exists(path: str) -> bool:
     """Check if path exists."""
-    return Path(path).exists()
+    return os.path.exists(path)
 
 
 def main():
@@ -67,9 +90,10 @@ def main():
     print("## File Change Signals\n")
     print("Integration-critical files and their last changes:\n")
 
+    last_changes = get_last_commit_infos(INTEGRATION_PATHS)
     for path in INTEGRATION_PATHS:
         exists = "✅ present" if path_exists(path) else "❌ missing"
-        last_change = get_last_commit_info(path)
+        last_change = last_changes[path]
         print(f"- **`{path}`**: {exists}")
         print(f"  - Last change: `{last_change}`")
 
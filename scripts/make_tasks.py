@@ -7,33 +7,33 @@
 """
 
 import argparse
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 
+# Preset placeholders substituted per generated task
+_PLACEHOLDER_RE = re.compile(r"\{(timestamp|trace_name|task_index)\}")
+
 
 def generate_trace_name(base_name: str, timestamp: str, index: int) -> str:
     """Generate a unique trace name."""
     return f"{base_name}-{timestamp}-{index:03d}"
 
 
-def generate_task_content(preset_path: Path, timestamp: str, trace_name: str, task_index: int) -> str:
-    """Generate task content from preset template."""
-
-    # Read preset template
-    with open(preset_path, encoding="utf-8") as f:
-        content = f.read()
+def generate_task_content(template: str, source_name: str, timestamp: str, trace_name: str, task_index: int) -> str:
+    """Generate task content from preset template text (source_name is the preset's file name)."""
 
-    # Replace placeholder variables
-    content = content.replace("{timestamp}", timestamp)
-    content = content.replace("{trace_name}", trace_name)
-    content = content.replace("{task_index}", str(task_index))
+    # Replace placeholder variables in one pass; any other braces in the preset are left alone
+    values = {"timestamp": timestamp, "trace_name": trace_name, "task_index": str(task_index)}
+    content = _PLACEHOLDER_RE.sub(lambda m: values[m.group(1)], template)
 
     # Add task generation metadata
     metadata_section = f"""
 
 ---
 **GENERATED TASK METADATA:**
-- Source preset: {preset_path.name}
+- Source preset: {source_name}
 - Generated at: {datetime.now().isoformat()}
 - Task index: {task_index}
 - Trace name: {trace_name}
@@ -43,6 +43,13 @@ def generate_task_content(preset_path: Path, timestamp: str, trace_name: str, ta
     return content + metadata_section
 
 
+def _write_task_file(item: tuple[Path, str]) -> Path:
+    """Write one generated task file and return its path."""
+    output_path, task_content = item
+    output_path.write_text(task_content, encoding="utf-8")
+    return output_path
+
+
 def create_task_files(preset_path: Path, count: int, output_dir: Path, base_timestamp: str = None) -> list[Path]:
     """Create multiple task files from a preset template."""
 
@@ -55,7 +62,10 @@ def create_task_files(preset_path: Path, count: int, output_dir: Path, base_time
     # Ensure output directory exists
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    created_files = []
+    # Read preset template once for all copies
+    template = preset_path.read_text(encoding="utf-8")
+
+    pending: list[tuple[Path, str]] = []
 
     for i in range(1, count + 1):
         # Create unique timestamp with slight offset
@@ -66,18 +76,18 @@ def create_task_files(preset_path: Path, count: int, output_dir: Path, base_time
         trace_name = generate_trace_name(preset_name, base_timestamp, i)
 
         # Generate content
-        task_content = generate_task_content(preset_path, task_timestamp_str, trace_name, i)
+        task_content = generate_task_content(template, preset_path.name, task_timestamp_str, trace_name, i)
 
         # Create output filename
         output_filename = f"{trace_name}.task.md"
-        output_path = output_dir / output_filename
+        pending.append((output_dir / output_filename, task_content))
 
-        # Write task file
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(task_content)
-
-        created_files.append(output_path)
-        print(f"Created: {output_path}")
+    # Write task files concurrently so open/write/close latency overlaps; map keeps the order
+    created_files = []
+    with ThreadPoolExecutor(max_workers=min(8, max(1, count))) as executor:
+        for output_path in executor.map(_write_task_file, pending):
+            created_files.append(output_path)
+            print(f"Created: {output_path}")
 
     return created_files
 
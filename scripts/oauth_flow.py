@@ -3,9 +3,22 @@
 This script guides you through the OAuth flow step-by-step.
 """
 
+import json
 import webbrowser
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# (connect, read): a dead server fails fast, a slow one still gets time to answer
+TIMEOUT = (2, 5)
+
+# Retries connection errors and gateway errors with jittered exponential backoff, not 4xx
+session = requests.Session()
+session.mount(
+    "http://",
+    HTTPAdapter(max_retries=Retry(total=3, backoff_factor=0.5, backoff_jitter=0.5, status_forcelist=[502, 503, 504])),
+)
 
 print("=" * 70)
 print("Google OAuth Flow - E2E Testing")
@@ -15,10 +28,10 @@
 # Step 1: Get authorization URL
 print("[Step 1/4] Fetching authorization URL from server...")
 try:
-    response = requests.get(
+    response = session.get(
         "http://localhost:8003/oauth/google/authorize",
         params={"workspace_id": "test-workspace-e2e", "redirect_uri": "http://localhost:8003/oauth/google/callback"},
-        timeout=5,
+        timeout=TIMEOUT,
     )
     response.raise_for_status()
     auth_data = response.json()
@@ -27,7 +40,7 @@
     state = auth_data["state"]
 
     print("[OK] Authorization URL generated")
-    print(f"     State: {state[:20]}...")
+    print(f"     State: {state[:20]}{'...' if len(state) > 20 else ''}")
     print()
 except Exception as e:
     print(f"[ERROR] Failed to fetch authorization URL: {e}")
@@ -69,20 +82,20 @@
 
 if callback_response:
     try:
-        import json
-
         callback_data = json.loads(callback_response)
-
-        if callback_data.get("success"):
+        # TypeError/KeyError: valid JSON, but not the callback's {"success": ...} object
+        success = callback_data["success"]
+    except (ValueError, KeyError, TypeError):
+        print("[WARN] Could not parse response as OAuth callback JSON")
+        print("       Manual verification needed (step 4)")
+    else:
+        if success:
             print("[OK] OAuth tokens stored successfully!")
             print(f"     Scopes: {callback_data.get('scopes', 'N/A')}")
             print(f"     Has refresh token: {callback_data.get('has_refresh_token', False)}")
         else:
             print("[ERROR] OAuth flow failed:")
             print(f"        {callback_data}")
-    except json.JSONDecodeError:
-        print("[WARN] Could not parse response as JSON")
-        print("       Manual verification needed (step 4)")
 else:
     print("[INFO] Skipping automatic verification")
 
@@ -94,8 +107,8 @@
 
 try:
     # Check token status endpoint
-    response = requests.get(
-        "http://localhost:8003/oauth/google/status", params={"workspace_id": "test-workspace-e2e"}, timeout=5
+    response = session.get(
+        "http://localhost:8003/oauth/google/status", params={"workspace_id": "test-workspace-e2e"}, timeout=TIMEOUT
     )
     response.raise_for_status()
     status_data = response.json()
@@ -6,74 +6,137 @@
   python pushgateway_synth.py --scenario latency-crit --duration 3m
   python pushgateway_synth.py --scenario controller-stalled --duration 10m
 """
+
 import argparse
+import atexit
+import gzip
 import os
+import signal
+import sys
+import threading
 import time
 
 import requests
+from requests.adapters import HTTPAdapter
 
 PG = os.getenv("PUSHGATEWAY_URL", "http://localhost:9091")
 JOB = "relay_synth"
 LABELS = {"provider": "google", "action": "gmail.send"}
 
+# One keep-alive session for every push, so each tick reuses the TCP/TLS connection
+SESSION = requests.Session()
+SESSION.mount(PG.split("://", 1)[0] + "://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+SESSION.headers.update({"Content-Type": "text/plain; version=0.0.4"})
+atexit.register(SESSION.close)
 
-def push_counter(metric, labels, value):
-    """Push a counter metric to Pushgateway using text exposition format."""
-    labelstr = ",".join(f'{k}="{v}"' for k, v in labels.items())
-    data = f"{metric}{{{labelstr}}} {value}\n"
+# Gzip request bodies larger than this; set from --gzip/--no-gzip and cleared if the server answers 415
+GZIP = True
+GZIP_MIN_BYTES = 1024
+
+# Seconds between pushes; scenarios sleep until the next tick so push latency doesn't stretch the period
+TICK_S = 10
+
+# Progress interval while a stall scenario waits
+HEARTBEAT_S = 30
+
+
+def fmt_labels(labels):
+    """Serialize a label dict as the inside of a text exposition label set."""
+    return ",".join(f'{k}="{v}"' for k, v in labels.items())
+
+
+# LABELS never change, so serialize them once
+BASE_LABELSTR = fmt_labels(LABELS)
+
+
+def fmt_line(metric, labelstr, value):
+    """Format one sample in text exposition format from a pre-serialized label string."""
+    return f"{metric}{{{labelstr}}} {value}\n"
+
+
+def push_batch(lines):
+    """Push several samples to Pushgateway in a single request.
+
+    PUT replaces the whole group, so every sample of one tick must go in the same batch.
+    """
+    global GZIP
     url = f"{PG}/metrics/job/{JOB}/instance/{int(time.time())}"
+    payload = "".join(lines).encode()
     try:
-        requests.post(url, data=data, timeout=3)
+        if GZIP and len(payload) > GZIP_MIN_BYTES:
+            resp = SESSION.put(url, data=gzip.compress(payload), headers={"Content-Encoding": "gzip"}, timeout=3)
+            if resp.status_code != 415:
+                return
+            print("Warning: Pushgateway rejected gzip body (415); sending uncompressed from now on")
+            GZIP = False
+        SESSION.put(url, data=payload, timeout=3)
     except Exception as e:
         print(f"Warning: Failed to push to Pushgateway: {e}")
 
 
+def push_counter(metric, labels, value):
+    """Push a counter metric to Pushgateway using text exposition format."""
+    push_batch([fmt_line(metric, fmt_labels(labels), value)])
+
+
 def scenario_error_rate_warn(seconds):
     """Drive ~2% error while keeping exec rate > threshold (0.1 req/s)."""
     print(f"[error-rate-warn] Injecting 2% error rate for {seconds}s...")
-    end = time.time() + seconds
+    start = time.monotonic()
+    end = start + seconds
+    next_tick = start
     iteration = 0
-    while time.time() < end:
-        # Push 50 executions with 1 error = 2% error rate
-        push_counter("action_exec_total", LABELS, 50)
-        push_counter("action_error_total", LABELS, 1)
+    # Push 50 executions with 1 error = 2% error rate
+    lines = [fmt_line("action_exec_total", BASE_LABELSTR, 50), fmt_line("action_error_total", BASE_LABELSTR, 1)]
+    while (now := time.monotonic()) < end:
+        push_batch(lines)
         iteration += 1
         if iteration % 6 == 0:  # Log every minute
-            print(f"  [{int(time.time() - (end - seconds))}s] Pushed exec=50, error=1 (2% rate)")
-        time.sleep(10)
+            print(f"  [{int(now - start)}s] Pushed exec=50, error=1 (2% rate)")
+        next_tick += TICK_S
+        time.sleep(max(0, next_tick - time.monotonic()))
     print("[error-rate-warn] Done. Alert should fire after ~10 minutes if threshold crossed.")
 
 
 def scenario_error_rate_crit(seconds):
     """Drive ~6% error to trigger critical alert."""
     print(f"[error-rate-crit] Injecting 6% error rate for {seconds}s...")
-    end = time.time() + seconds
+    start = time.monotonic()
+    end = start + seconds
+    next_tick = start
     iteration = 0
-    while time.time() < end:
-        # Push 50 executions with 3 errors = 6% error rate
-        push_counter("action_exec_total", LABELS, 50)
-        push_counter("action_error_total", LABELS, 3)
+    # Push 50 executions with 3 errors = 6% error rate
+    lines = [fmt_line("action_exec_total", BASE_LABELSTR, 50), fmt_line("action_error_total", BASE_LABELSTR, 3)]
+    while (now := time.monotonic()) < end:
+        push_batch(lines)
         iteration += 1
         if iteration % 6 == 0:
-            print(f"  [{int(time.time() - (end - seconds))}s] Pushed exec=50, error=3 (6% rate)")
-        time.sleep(10)
+            print(f"  [{int(now - start)}s] Pushed exec=50, error=3 (6% rate)")
+        next_tick += TICK_S
+        time.sleep(max(0, next_tick - time.monotonic()))
     print("[error-rate-crit] Done. Critical alert should fire after ~10 minutes.")
 
 
 def scenario_latency_crit(seconds):
     """Push latency buckets so P95 > 2s (critical threshold)."""
     print(f"[latency-crit] Injecting high P95 latency (>2s) for {seconds}s...")
-    end = time.time() + seconds
+    start = time.monotonic()
+    end = start + seconds
+    next_tick = start
     iteration = 0
-    while time.time() < end:
-        # Push histogram buckets where most requests are in high latency buckets
-        # To get P95 > 2s, put 95% of requests in buckets > 2s
-        for le, count in [("0.1", 1), ("0.5", 2), ("1", 2), ("2", 5), ("+Inf", 50)]:
-            push_counter("action_latency_seconds_bucket", {**LABELS, "le": le}, count)
+    # Push histogram buckets where most requests are in high latency buckets
+    # To get P95 > 2s, put 95% of requests in buckets > 2s
+    lines = [
+        fmt_line("action_latency_seconds_bucket", f'{BASE_LABELSTR},le="{le}"', count)
+        for le, count in [("0.1", 1), ("0.5", 2), ("1", 2), ("2", 5), ("+Inf", 50)]
+    ]
+    while (now := time.monotonic()) < end:
+        push_batch(lines)
         iteration += 1
         if iteration % 6 == 0:
-            print(f"  [{int(time.time() - (end - seconds))}s] Pushed latency histogram (P95 ~2.5s)")
-        time.sleep(10)
+            print(f"  [{int(now - start)}s] Pushed latency histogram (P95 ~2.5s)")
+        next_tick += TICK_S
+        time.sleep(max(0, next_tick - time.monotonic()))
     print("[latency-crit] Done. Latency critical alert should fire after ~10 minutes.")
 
 
@@ -82,56 +145,86 @@ def scenario_controller_stalled(seconds):
     print(f"[controller-stalled] Simulating controller stall for {seconds}s...")
     print("  (No metrics pushed; existing metrics will age out)")
     print("  Note: Alert fires after 60m of no successful runs + 5m for-period")
-    time.sleep(seconds)
+    # Wait in heartbeat-sized slices on an Event so Ctrl-C ends the stall cleanly and promptly
+    stop = threading.Event()
+    previous_handler = signal.signal(signal.SIGINT, lambda signum, frame: stop.set())
+    start = time.monotonic()
+    end = start + seconds
+    try:
+        while (remaining := end - time.monotonic()) > 0:
+            if stop.wait(min(HEARTBEAT_S, remaining)):
+                print(f"[controller-stalled] Interrupted after {int(time.monotonic() - start)}s.")
+                return
+            print(f"  [heartbeat {int(time.monotonic() - start)}s] still stalling...")
+    finally:
+        signal.signal(signal.SIGINT, previous_handler)
     print("[controller-stalled] Done. If this ran for 65+ minutes, stalled alert should fire.")
 
 
 def scenario_validation_spike(seconds):
     """Push high structured error rate to trigger validation spike (>10% info alert)."""
     print(f"[validation-spike] Injecting 15% validation error rate for {seconds}s...")
-    end = time.time() + seconds
+    start = time.monotonic()
+    end = start + seconds
+    next_tick = start
     iteration = 0
-    while time.time() < end:
-        # Push high structured error count relative to traffic
-        push_counter("action_exec_total", LABELS, 100)
-        push_counter("structured_error_total", {**LABELS, "code": "INVALID_RECIPIENT", "source": "validation"}, 15)
+    # Push high structured error count relative to traffic
+    lines = [
+        fmt_line("action_exec_total", BASE_LABELSTR, 100),
+        fmt_line("structured_error_total", f'{BASE_LABELSTR},code="INVALID_RECIPIENT",source="validation"', 15),
+    ]
+    while (now := time.monotonic()) < end:
+        push_batch(lines)
         iteration += 1
         if iteration % 6 == 0:
-            print(f"  [{int(time.time() - (end - seconds))}s] Pushed structured_error=15, exec=100 (15% rate)")
-        time.sleep(10)
+            print(f"  [{int(now - start)}s] Pushed structured_error=15, exec=100 (15% rate)")
+        next_tick += TICK_S
+        time.sleep(max(0, next_tick - time.monotonic()))
     print("[validation-spike] Done. Validation spike (info) alert should fire after ~10 minutes.")
 
 
 def scenario_mime_slow(seconds):
     """Push MIME builder P95 > 500ms (warning threshold)."""
     print(f"[mime-slow] Injecting slow MIME build times (P95 ~600ms) for {seconds}s...")
-    end = time.time() + seconds
+    start = time.monotonic()
+    end = start + seconds
+    next_tick = start
     iteration = 0
-    while time.time() < end:
-        # Push MIME histogram with most requests in 0.5-1s bucket
-        for le, count in [("0.1", 5), ("0.5", 20), ("1", 50), ("+Inf", 50)]:
-            push_counter("gmail_mime_build_seconds_bucket", {"le": le}, count)
+    # Push MIME histogram with most requests in 0.5-1s bucket
+    lines = [
+        fmt_line("gmail_mime_build_seconds_bucket", f'le="{le}"', count)
+        for le, count in [("0.1", 5), ("0.5", 20), ("1", 50), ("+Inf", 50)]
+    ]
+    while (now := time.monotonic()) < end:
+        push_batch(lines)
         iteration += 1
         if iteration % 6 == 0:
-            print(f"  [{int(time.time() - (end - seconds))}s] Pushed MIME histogram (P95 ~600ms)")
-        time.sleep(10)
+            print(f"  [{int(now - start)}s] Pushed MIME histogram (P95 ~600ms)")
+        next_tick += TICK_S
+        time.sleep(max(0, next_tick - time.monotonic()))
     print("[mime-slow] Done. MIME slow performance alert should fire after ~10 minutes.")
 
 
 def scenario_sanitization_spike(seconds):
     """Push high HTML sanitization rate (>50/sec) to trigger info alert."""
     print(f"[sanitization-spike] Injecting high sanitization activity (>50/sec) for {seconds}s...")
-    end = time.time() + seconds
+    start = time.monotonic()
+    end = start + seconds
+    next_tick = start
     iteration = 0
-    while time.time() < end:
-        # Push sanitization changes: 60 changes over 10s = 6/sec * 10 = 60 total
-        # Rate over 5m window needs to exceed 50/sec, so push aggressively
-        push_counter("gmail_html_sanitization_changes_total", {"change_type": "tag_removed"}, 300)
-        push_counter("gmail_html_sanitization_changes_total", {"change_type": "attr_stripped"}, 300)
+    # Push sanitization changes: 60 changes over 10s = 6/sec * 10 = 60 total
+    # Rate over 5m window needs to exceed 50/sec, so push aggressively
+    lines = [
+        fmt_line("gmail_html_sanitization_changes_total", 'change_type="tag_removed"', 300),
+        fmt_line("gmail_html_sanitization_changes_total", 'change_type="attr_stripped"', 300),
+    ]
+    while (now := time.monotonic()) < end:
+        push_batch(lines)
         iteration += 1
         if iteration % 6 == 0:
-            print(f"  [{int(time.time() - (end - seconds))}s] Pushed sanitization=600 changes (60/sec)")
-        time.sleep(10)
+            print(f"  [{int(now - start)}s] Pushed sanitization=600 changes (60/sec)")
+        next_tick += TICK_S
+        time.sleep(max(0, next_tick - time.monotonic()))
     print("[sanitization-spike] Done. Sanitization spike (info) alert should fire after ~5 minutes.")
 
 
@@ -150,7 +243,14 @@ def scenario_sanitization_spike(seconds):
     parser = argparse.ArgumentParser(description="Synthetic alert driver for testing Prometheus alerts")
     parser.add_argument("--scenario", choices=SCENARIOS.keys(), required=True, help="Alert scenario to simulate")
     parser.add_argument("--duration", default="5m", help="Duration to run scenario (e.g., 5m, 30s)")
+    parser.add_argument(
+        "--gzip",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help=f"Gzip push bodies larger than {GZIP_MIN_BYTES} bytes (default: on)",
+    )
     args = parser.parse_args()
+    GZIP = args.gzip
 
     # Parse duration
     duration_str = args.duration
@@ -167,6 +267,9 @@ def scenario_sanitization_spike(seconds):
     print(f"Pushgateway: {PG}")
     print(f"Job: {JOB}\n")
 
+    # Progress lines are left to stdout's own buffering (block-buffered when redirected to a log);
+    # flush the banner before the scenario starts so a tailed log shows the run has begun
+    sys.stdout.flush()
     SCENARIOS[args.scenario](seconds)
 
     print("\n=== Scenario complete ===")
@@ -11,6 +11,9 @@
 import sys
 from pathlib import Path
 
+# Version section header, like: ## [1.0.0] - 2025-10-18
+_VERSION_RE = re.compile(r"## \[([^\]]+)\] - (\d{4}-\d{2}-\d{2})")
+
 
 def get_project_root() -> Path:
     """Get the project root directory."""
@@ -31,32 +34,22 @@ def extract_version_notes(changelog: str, version: str | None = None) -> tuple[s
     Returns:
         Tuple of (version, notes)
     """
-    # Split by version headers
-    version_pattern = r"## \[([^\]]+)\] - (\d{4}-\d{2}-\d{2})"
-    sections = re.split(version_pattern, changelog)
+    # Walk version headers lazily; only the requested section is ever sliced out
+    headers = _VERSION_RE.finditer(changelog)
+
+    found_any = False
+    for header in headers:
+        found_any = True
+        # No version requested means latest, i.e. the first section
+        if version and header.group(1) != version:
+            continue
+        next_header = next(headers, None)
+        end = next_header.start() if next_header else len(changelog)
+        return header.group(1), changelog[header.end() : end].strip()
 
-    # sections will be: [header, version1, date1, content1, version2, date2, content2, ...]
-    if len(sections) < 4:
+    if not found_any:
         raise ValueError("No version sections found in CHANGELOG.md")
-
-    # Parse versions
-    versions = []
-    for i in range(1, len(sections), 3):
-        if i + 2 < len(sections):
-            versions.append({"version": sections[i], "date": sections[i + 1], "content": sections[i + 2].strip()})
-
-    if not versions:
-        raise ValueError("No versions found in CHANGELOG.md")
-
-    # Get requested version or latest
-    if version:
-        for v in versions:
-            if v["version"] == version:
-                return v["version"], v["content"]
-        raise ValueError(f"Version {version} not found in CHANGELOG.md")
-    else:
-        # Return latest
-        return versions[0]["version"], versions[0]["content"]
+    raise ValueError(f"Version {version} not found in CHANGELOG.md")
 
 
 def format_github_release(version: str, notes: str) -> str:
@@ -64,7 +57,7 @@ def format_github_release(version: str, notes: str) -> str:
     # Clean up empty bullet points
     lines = notes.split("\n")
     cleaned = []
-    for line in lines:
+    for idx, line in enumerate(lines):
         stripped = line.strip()
         # Skip empty bullet points
         if stripped in ["- ", "-"]:
@@ -72,7 +65,7 @@ def format_github_release(version: str, notes: str) -> str:
         # Skip empty sections
         if stripped.startswith("###") and not any(
             lines[i].strip().startswith("-") and lines[i].strip() not in ["- ", "-"]
-            for i in range(lines.index(line) + 1, min(lines.index(line) + 10, len(lines)))
+            for i in range(idx + 1, min(idx + 10, len(lines)))
             if not lines[i].strip().startswith("###")
         ):
             continue
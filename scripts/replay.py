@@ -6,28 +6,64 @@
 """
 
 import argparse
+import heapq
 import json
+import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Optional
 
+import ujson
 
-def find_artifact_files(runs_dir: str = "runs") -> list[Path]:
-    """Find all artifact files in the runs directory."""
-    runs_path = Path(runs_dir)
-    if not runs_path.exists():
+# Cached --list summaries, kept next to the artifacts
+INDEX_NAME = ".index.jsonl"
+
+# Run parameters that aren't replayed as CLI options (allowed_models is handled by policy)
+_SKIP_PARAMS = frozenset({"allowed_models"})
+
+# Boolean parameters passed as bare flags, and only when set
+_FLAG_PARAMS = frozenset({"fastpath"})
+
+# The CLI hands the process over to the replayed run; Windows has no real exec, so it waits on a child
+EXEC_REPLAY = os.name != "nt"
+
+
+def find_artifact_files(runs_dir: str = "runs", limit: Optional[int] = None) -> list[Path]:
+    """Find artifact files in the runs directory, newest first.
+
+    Args:
+        runs_dir: Directory containing run artifacts
+        limit: Only return the newest `limit` files (default: all)
+
+    Returns:
+        Artifact paths ordered by modification time, newest first
+    """
+    try:
+        with os.scandir(runs_dir) as it:
+            # DirEntry caches its stat; the name breaks mtime ties
+            entries = [
+                (entry.stat().st_mtime_ns, entry.name, entry.path)
+                for entry in it
+                if entry.name.endswith(".json") and entry.is_file()
+            ]
+    except FileNotFoundError:
         return []
 
-    return sorted(runs_path.glob("*.json"), reverse=True)
+    if limit is None:
+        newest = sorted(entries, reverse=True)
+    else:
+        newest = heapq.nlargest(limit, entries)
+    return [Path(path) for _, _, path in newest]
 
 
 def load_artifact(artifact_path: Path) -> dict[str, Any]:
     """Load an artifact file."""
     try:
-        with open(artifact_path, encoding="utf-8") as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError) as e:
+        # ujson (already used to write artifacts) decodes the raw UTF-8 bytes directly
+        return ujson.loads(Path(artifact_path).read_bytes())
+    except (FileNotFoundError, ValueError) as e:
         raise ValueError(f"Cannot load artifact {artifact_path}: {e}")
 
 
@@ -49,49 +85,120 @@ def extract_cli_args(artifact: dict[str, Any]) -> list[str]:
 
     # Add all parameters from the original run
     for key, value in parameters.items():
-        if key == "allowed_models":
-            # Skip this as it's handled by policy
+        if key in _SKIP_PARAMS:
             continue
-
-        if key == "fastpath" and value:
-            args.append("--fastpath")
-        elif key != "fastpath":
-            args.extend([f"--{key}", str(value)])
+        if key in _FLAG_PARAMS:
+            if value:
+                args.append(f"--{key}")
+        else:
+            args += (f"--{key}", str(value))
 
     return args
 
 
+def summarize_artifact(artifact_path: Path, mtime_ns: int) -> dict[str, Any]:
+    """Build the index entry shown by --list for one artifact."""
+    entry: dict[str, Any] = {"name": artifact_path.name, "mtime_ns": mtime_ns}
+    try:
+        artifact = load_artifact(artifact_path)
+        metadata = artifact.get("run_metadata", {})
+        publish = artifact.get("publish", {})
+        task = metadata.get("task", "")
+
+        entry["timestamp"] = metadata.get("timestamp", "Unknown")[:19]  # Remove microseconds
+        entry["task_preview"] = task[:40] + ("..." if len(task) > 40 else "")
+        entry["status"] = publish.get("status", "unknown")
+        entry["provider"] = publish.get("provider", "unknown")
+    except Exception as e:
+        entry["error"] = str(e)
+    return entry
+
+
+def update_run_index(runs_dir: str = "runs") -> list[dict[str, Any]]:
+    """Return --list summaries for every artifact, parsing only artifacts not yet in the index.
+
+    Summaries are cached in runs/.index.jsonl, one JSON object per line with the artifact's
+    mtime. Artifacts that are new or whose mtime changed are parsed and appended; a later
+    line for the same name supersedes an earlier one.
+
+    Args:
+        runs_dir: Directory containing run artifacts
+
+    Returns:
+        One summary per artifact currently in runs_dir, in no particular order
+    """
+    index_path = Path(runs_dir) / INDEX_NAME
+    try:
+        with os.scandir(runs_dir) as it:
+            current = {
+                entry.name: entry.stat().st_mtime_ns for entry in it if entry.name.endswith(".json") and entry.is_file()
+            }
+    except FileNotFoundError:
+        return []
+
+    indexed: dict[str, dict[str, Any]] = {}
+    index_lines = 0
+    try:
+        with open(index_path, encoding="utf-8") as f:
+            for line in f:
+                index_lines += 1
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # torn write; the artifact is re-indexed below
+                indexed[entry["name"]] = entry
+    except FileNotFoundError:
+        pass
+
+    # New or rewritten since indexing; the scandir stat above is all it takes to tell
+    stale = sorted(
+        (mtime_ns, name) for name, mtime_ns in current.items() if indexed.get(name, {}).get("mtime_ns") != mtime_ns
+    )
+    paths = [Path(runs_dir) / name for _, name in stale]
+    mtimes = [mtime_ns for mtime_ns, _ in stale]
+    if len(stale) > 1:
+        # Artifact reads are I/O bound, so overlap them when there's a backlog (e.g. a cold index)
+        with ThreadPoolExecutor(max_workers=min(8, len(stale))) as pool:
+            new_entries = list(pool.map(summarize_artifact, paths, mtimes))
+    else:
+        new_entries = list(map(summarize_artifact, paths, mtimes))
+    indexed.update((entry["name"], entry) for entry in new_entries)
+
+    live = [indexed[name] for name in current]
+    # Rewrite instead of append once superseded and deleted entries make up half the file
+    compact = index_lines + len(new_entries) > 2 * max(len(live), 1)
+    if new_entries or compact:
+        try:
+            with open(index_path, "w" if compact else "a", encoding="utf-8") as f:
+                f.write("".join(json.dumps(entry) + "\n" for entry in (live if compact else new_entries)))
+        except OSError:
+            pass  # read-only runs/; listing still works, it just isn't cached
+
+    return live
+
+
 def list_recent_runs(limit: int = 10) -> None:
     """List recent runs with basic info."""
-    artifact_files = find_artifact_files()
+    entries = heapq.nlargest(limit, update_run_index(), key=lambda e: (e["mtime_ns"], e["name"]))
 
-    if not artifact_files:
+    if not entries:
         print("No artifact files found in runs/ directory")
         return
 
     print(f"Recent runs (showing last {limit}):")
     print("=" * 70)
 
-    for i, artifact_path in enumerate(artifact_files[:limit], 1):
-        try:
-            artifact = load_artifact(artifact_path)
-            metadata = artifact.get("run_metadata", {})
-            publish = artifact.get("publish", {})
-
-            timestamp = metadata.get("timestamp", "Unknown")[:19]  # Remove microseconds
-            task_preview = metadata.get("task", "")[:40] + ("..." if len(metadata.get("task", "")) > 40 else "")
-            status = publish.get("status", "unknown")
-            provider = publish.get("provider", "unknown")
-
-            print(f"{i:2d}. {artifact_path.name}")
-            print(f"    {timestamp} | Status: {status}")
-            print(f"    Task: {task_preview}")
-            print(f"    Provider: {provider}")
+    for i, entry in enumerate(entries, 1):
+        if "error" in entry:
+            print(f"{i:2d}. {entry['name']} [ERROR: {entry['error']}]")
             print()
+            continue
 
-        except Exception as e:
-            print(f"{i:2d}. {artifact_path.name} [ERROR: {e}]")
-            print()
+        print(f"{i:2d}. {entry['name']}")
+        print(f"    {entry['timestamp']} | Status: {entry['status']}")
+        print(f"    Task: {entry['task_preview']}")
+        print(f"    Provider: {entry['provider']}")
+        print()
 
 
 def show_run_details(artifact_path: Path) -> None:
@@ -133,7 +240,11 @@ def show_run_details(artifact_path: Path) -> None:
 
 
 def replay_run(
-    artifact_path: Path, new_task: Optional[str] = None, new_trace_name: Optional[str] = None, dry_run: bool = False
+    artifact_path: Path,
+    new_task: Optional[str] = None,
+    new_trace_name: Optional[str] = None,
+    dry_run: bool = False,
+    exec_replace: bool = False,
 ) -> int:
     """
     Replay a run with the same configuration.
@@ -143,6 +254,8 @@ def replay_run(
         new_task: Optional new task (uses original if not provided)
         new_trace_name: Optional new trace name
         dry_run: If True, just show the command without running it
+        exec_replace: If True, replace this process with the replay (os.execvp) instead of
+            waiting on a child; does not return on success
 
     Returns:
         Exit code (0 for success)
@@ -156,14 +269,12 @@ def replay_run(
             task_index = args.index("--task")
             args[task_index + 1] = new_task
 
+        trace_index = args.index("--trace_name")
         if new_trace_name:
-            trace_index = args.index("--trace_name")
             args[trace_index + 1] = new_trace_name
         else:
             # Add replay suffix to distinguish from original
-            trace_index = args.index("--trace_name")
-            original_trace = args[trace_index + 1]
-            args[trace_index + 1] = f"{original_trace}-replay"
+            args[trace_index + 1] = f"{args[trace_index + 1]}-replay"
 
         cmd = ["python", "-m", "src.run_workflow"] + args
 
@@ -178,6 +289,9 @@ def replay_run(
         print("-" * 50)
 
         # Execute the replay command
+        if exec_replace:
+            sys.stdout.flush()
+            os.execvp(cmd[0], cmd)
         result = subprocess.run(cmd, cwd=Path.cwd())
         return result.returncode
 
@@ -251,15 +365,15 @@ def main():
         if not artifact_path.exists():
             print(f"Error: Artifact file not found: {artifact_path}")
             return 1
-        return replay_run(artifact_path, args.task, args.trace_name, args.dry_run)
+        return replay_run(artifact_path, args.task, args.trace_name, args.dry_run, exec_replace=EXEC_REPLAY)
 
     elif args.latest:
-        artifact_files = find_artifact_files()
+        artifact_files = find_artifact_files(limit=1)
         if not artifact_files:
             print("Error: No artifact files found")
             return 1
         latest_artifact = artifact_files[0]
-        return replay_run(latest_artifact, args.task, args.trace_name, args.dry_run)
+        return replay_run(latest_artifact, args.task, args.trace_name, args.dry_run, exec_replace=EXEC_REPLAY)
 
     return 0
 
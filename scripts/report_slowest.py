@@ -7,14 +7,20 @@
 Reads pytest output with --durations=N flag and produces a sorted
 markdown table of the slowest tests for performance tracking.
 """
+
 from __future__ import annotations
 
 import re
 import sys
+from collections.abc import Iterable
+from operator import itemgetter
 from pathlib import Path
 
+# One duration line, like: "1.23s call     tests/test_foo.py::test_bar"
+_DURATION_RE = re.compile(r"^\s*([\d.]+)s\s+\w+\s+(.+)$")
+
 
-def parse_durations(lines: list[str]) -> list[tuple[float, str]]:
+def parse_durations(lines: Iterable[str]) -> list[tuple[float, str]]:
     """Extract (duration_seconds, test_name) from pytest --durations output."""
     durations = []
     in_section = False
@@ -32,8 +38,7 @@ def parse_durations(lines: list[str]) -> list[tuple[float, str]]:
         if not line.strip() or line.startswith("="):
             break
 
-        # Parse line like: "1.23s call     tests/test_foo.py::test_bar"
-        match = re.match(r"^\s*([\d.]+)s\s+\w+\s+(.+)$", line)
+        match = _DURATION_RE.match(line)
         if match:
             duration = float(match.group(1))
             test_name = match.group(2).strip()
@@ -44,21 +49,20 @@ def parse_durations(lines: list[str]) -> list[tuple[float, str]]:
 
 def generate_markdown(durations: list[tuple[float, str]], output_path: Path) -> None:
     """Write markdown table of slowest tests."""
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write("# Slowest Tests Report\n\n")
-        f.write(f"Total tests analyzed: {len(durations)}\n\n")
-
-        if not durations:
-            f.write("_No duration data found._\n")
-            return
+    parts = ["# Slowest Tests Report\n\n", f"Total tests analyzed: {len(durations)}\n\n"]
 
-        f.write("| Duration (s) | Test |\n")
-        f.write("|--------------|------|\n")
+    if not durations:
+        parts.append("_No duration data found._\n")
+    else:
+        parts.append("| Duration (s) | Test |\n")
+        parts.append("|--------------|------|\n")
+        parts.extend(
+            f"| {duration:.2f} | `{test_name}` |\n"
+            for duration, test_name in sorted(durations, key=itemgetter(0), reverse=True)
+        )
+        parts.append("\n_Generated from pytest --durations output_\n")
 
-        for duration, test_name in sorted(durations, reverse=True):
-            f.write(f"| {duration:.2f} | `{test_name}` |\n")
-
-        f.write("\n_Generated from pytest --durations output_\n")
+    output_path.write_text("".join(parts), encoding="utf-8")
 
 
 def main() -> int:
@@ -73,10 +77,9 @@ def main() -> int:
         print(f"Error: {input_path} not found", file=sys.stderr)
         return 1
 
+    # Stream the log; parsing stops at the end of the durations section
     with open(input_path, encoding="utf-8") as f:
-        lines = f.readlines()
-
-    durations = parse_durations(lines)
+        durations = parse_durations(f)
     generate_markdown(durations, output_path)
 
     print(f"Generated {output_path} with {len(durations)} entries")
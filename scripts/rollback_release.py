@@ -12,6 +12,7 @@
 import os
 import sys
 from datetime import datetime
+from pathlib import Path
 
 
 def get_railway_token():
@@ -35,30 +36,41 @@ def rollback_deployment(deployment_id: str, token: str):
     os.makedirs("docs/evidence/sprint-51/phase3", exist_ok=True)
     rollback_path = "docs/evidence/sprint-51/phase3/ROLLBACK-NOTES.md"
 
-    with open(rollback_path, "w") as f:
-        f.write("# Rollback Notes\n\n")
-        f.write(f"**Date:** {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}\n")
-        f.write(f"**Failed Deployment ID:** {deployment_id}\n\n")
-        f.write("## Reason\n\n")
-        f.write("Deployment failed smoke tests. Automated rollback triggered.\n\n")
-        f.write("## Manual Rollback Steps\n\n")
-        f.write("1. Go to Railway dashboard: https://railway.app/project/relay-backend\n")
-        f.write("2. Navigate to Deployments tab\n")
-        f.write(f"3. Find deployment ID: {deployment_id}\n")
-        f.write("4. Click 'Redeploy' on the previous successful deployment\n\n")
-        f.write("## Verification\n\n")
-        f.write("After rollback:\n")
-        f.write("```bash\n")
-        f.write("curl -s https://relay-production-f2a6.up.railway.app/_stcore/health\n")
-        f.write('# Expected: {"ok":true}\n')
-        f.write("```\n\n")
-        f.write("## Railway CLI Rollback\n\n")
-        f.write("```bash\n")
-        f.write("# List recent deployments\n")
-        f.write("railway status\n\n")
-        f.write("# Redeploy previous version\n")
-        f.write("railway redeploy --previous\n")
-        f.write("```\n")
+    notes = f"""# Rollback Notes
+
+**Date:** {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}
+**Failed Deployment ID:** {deployment_id}
+
+## Reason
+
+Deployment failed smoke tests. Automated rollback triggered.
+
+## Manual Rollback Steps
+
+1. Go to Railway dashboard: https://railway.app/project/relay-backend
+2. Navigate to Deployments tab
+3. Find deployment ID: {deployment_id}
+4. Click 'Redeploy' on the previous successful deployment
+
+## Verification
+
+After rollback:
+```bash
+curl -s https://relay-production-f2a6.up.railway.app/_stcore/health
+# Expected: {{"ok":true}}
+```
+
+## Railway CLI Rollback
+
+```bash
+# List recent deployments
+railway status
+
+# Redeploy previous version
+railway redeploy --previous
+```
+"""
+    Path(rollback_path).write_text(notes, encoding="utf-8")
 
     print(f"[INFO] Rollback notes written to: {rollback_path}")
 
@@ -16,6 +16,12 @@
 
 import yaml
 
+try:
+    # libyaml-backed parser when PyYAML was built with it; same safe-load semantics
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -25,8 +31,8 @@
 
 def load_dag_from_yaml(path: str) -> DAG:
     """Load DAG from YAML file."""
-    with open(path, encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    # Hand libyaml the raw bytes; it detects the encoding itself
+    data = yaml.load(Path(path).read_bytes(), Loader=SafeLoader)
 
     tasks = [
         Task(
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Run the Gmail E2E test suite with environment from .env.e2e
+
+Usage:
+    python scripts/run_e2e.py                  # all scenarios
+    python scripts/run_e2e.py --scenarios 6    # only Scenario 6 (validation tests)
+"""
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from scripts._envfile import load_env  # noqa: E402
+
+# Windows has no real exec: the CRT spawns a detached process and the caller sees exit 0, so wait on a child there
+EXEC_TESTS = os.name != "nt"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run E2E tests with environment from .env.e2e")
+    parser.add_argument("--scenarios", default="all", help="Scenarios to run: all or a comma-separated list")
+    args = parser.parse_args(argv)
+
+    env_file = ROOT / ".env.e2e"
+    if not env_file.exists():
+        print(f"ERROR: {env_file} not found")
+        return 1
+
+    env = load_env(env_file)
+    os.environ.update(env)
+    lines = [f"Loading environment from {env_file}\n"]
+    lines.extend(
+        f"  {key}={env[key]}\n" for key in ("E2E_WORKSPACE_ID", "E2E_ACTOR_ID", "E2E_RECIPIENT_EMAIL") if key in env
+    )
+    sys.stdout.write("".join(lines))
+
+    if args.scenarios == "all":
+        print("\nRunning E2E test suite...")
+    else:
+        print(f"\nRunning scenarios {args.scenarios}...")
+    print("=" * 70)
+
+    sys.stdout.flush()
+    test_script = str(ROOT / "scripts" / "e2e_gmail_test.py")
+    cmd = [sys.executable, test_script, "--scenarios", args.scenarios, "--verbose"]
+    if EXEC_TESTS:
+        # Replace this process so no idle parent stays resident during the run
+        os.execvp(cmd[0], cmd)
+    return subprocess.run(cmd, env=os.environ).returncode
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,9 +6,12 @@
 """
 
 import json
+import os
 import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Optional
+
+import ujson
 
 try:
     import jsonschema
@@ -18,17 +21,66 @@
     JSONSCHEMA_AVAILABLE = False
     print("Warning: jsonschema not available. Install with: pip install jsonschema")
 
+try:
+    # optional: generates a specialized validation function per schema, much faster for bulk checks
+    import fastjsonschema
+
+    FASTJSONSCHEMA_AVAILABLE = True
+except ImportError:
+    FASTJSONSCHEMA_AVAILABLE = False
+
 
 def load_schema(schema_path: Path) -> dict[str, Any]:
     """Load a JSON schema file."""
     try:
-        with open(schema_path, encoding="utf-8") as f:
-            return json.load(f)
+        return ujson.loads(schema_path.read_bytes())
     except Exception as e:
         print(f"Error loading schema {schema_path}: {e}")
         return None
 
 
+# Compiled validators keyed by canonical schema JSON, so each distinct schema is checked and built once
+_VALIDATORS: dict[str, Any] = {}
+_COMPILED: dict[str, Callable[[Any], Any]] = {}
+
+
+def get_validator(schema: dict[str, Any]) -> Any:
+    """Return a reusable Draft7Validator for schema.
+
+    Raises:
+        jsonschema.SchemaError: If the schema itself is invalid
+    """
+    key = json.dumps(schema, sort_keys=True)
+    validator = _VALIDATORS.get(key)
+    if validator is None:
+        jsonschema.Draft7Validator.check_schema(schema)
+        validator = _VALIDATORS[key] = jsonschema.Draft7Validator(schema)
+    return validator
+
+
+def compile_validator(schema: dict[str, Any]) -> Callable[[Any], Any]:
+    """Return a function that raises if its argument doesn't match schema.
+
+    Uses fastjsonschema's generated code when installed, else the cached Draft7Validator.
+    """
+    key = json.dumps(schema, sort_keys=True)
+    validate = _COMPILED.get(key)
+    if validate is None:
+        validate = _COMPILED[key] = (
+            fastjsonschema.compile(schema) if FASTJSONSCHEMA_AVAILABLE else get_validator(schema).validate
+        )
+    return validate
+
+
+def scan_json(directory: Path) -> Optional[list[os.DirEntry]]:
+    """List the *.json files in directory with one scandir pass, or None if it doesn't exist."""
+    try:
+        with os.scandir(directory) as it:
+            return [entry for entry in it if entry.name.endswith(".json") and entry.is_file()]
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
 def create_sample_artifact() -> dict[str, Any]:
     """Create a sample artifact for validation testing."""
     return {
@@ -108,53 +160,50 @@ def validate_schemas() -> int:
 
     errors = 0
     schemas_dir = Path("schemas")
+    schema_files = scan_json(schemas_dir)
 
-    if not schemas_dir.exists():
+    if schema_files is None:
         print(f"ERROR: Schemas directory not found: {schemas_dir}")
         return 1
 
     print("Validating schemas...")
+    schema_names = {entry.name for entry in schema_files}
 
     # Load and validate artifact schema
     artifact_schema_path = schemas_dir / "artifact.json"
-    if artifact_schema_path.exists():
+    if artifact_schema_path.name in schema_names:
         artifact_schema = load_schema(artifact_schema_path)
         if artifact_schema:
             try:
                 # Validate the schema itself
-                jsonschema.Draft7Validator.check_schema(artifact_schema)
+                artifact_validator = get_validator(artifact_schema)
                 print(f"[OK] Schema valid: {artifact_schema_path}")
 
                 # Validate sample artifact against schema
                 sample_artifact = create_sample_artifact()
-                jsonschema.validate(sample_artifact, artifact_schema)
+                artifact_validator.validate(sample_artifact)
                 print("[OK] Sample artifact validates against schema")
 
                 # Try to validate any existing artifacts
-                runs_dir = Path("runs")
-                if runs_dir.exists():
-                    artifacts = list(runs_dir.glob("*.json"))
-                    if artifacts:
-                        # Validate the most recent artifact
-                        latest_artifact = max(artifacts, key=lambda x: x.stat().st_mtime)
-                        try:
-                            with open(latest_artifact, encoding="utf-8") as f:
-                                real_artifact = json.load(f)
-
-                            # Check schema version
-                            version = real_artifact.get("schema_version", "unknown")
-                            if version == "unknown":
-                                print(f"[WARN] Artifact {latest_artifact.name} missing schema_version field")
-                            elif version != "1.0":
-                                print(
-                                    f"[WARN] Artifact {latest_artifact.name} has schema version {version}, expected 1.0"
-                                )
-
-                            jsonschema.validate(real_artifact, artifact_schema)
-                            print(f"[OK] Real artifact validates: {latest_artifact.name}")
-                        except Exception as e:
-                            print(f"[WARN] Real artifact validation failed: {latest_artifact.name} - {e}")
-                            # Don't count as error since existing artifacts might not have new fields
+                artifacts = scan_json(Path("runs"))
+                if artifacts:
+                    # Validate the most recent artifact
+                    latest_artifact = Path(max(artifacts, key=lambda e: e.stat().st_mtime).path)
+                    try:
+                        real_artifact = ujson.loads(latest_artifact.read_bytes())
+
+                        # Check schema version
+                        version = real_artifact.get("schema_version", "unknown")
+                        if version == "unknown":
+                            print(f"[WARN] Artifact {latest_artifact.name} missing schema_version field")
+                        elif version != "1.0":
+                            print(f"[WARN] Artifact {latest_artifact.name} has schema version {version}, expected 1.0")
+
+                        artifact_validator.validate(real_artifact)
+                        print(f"[OK] Real artifact validates: {latest_artifact.name}")
+                    except Exception as e:
+                        print(f"[WARN] Real artifact validation failed: {latest_artifact.name} - {e}")
+                        # Don't count as error since existing artifacts might not have new fields
 
             except jsonschema.SchemaError as e:
                 print(f"[ERROR] Schema error in {artifact_schema_path}: {e}")
@@ -170,23 +219,23 @@ def validate_schemas() -> int:
 
     # Load and validate policy schema
     policy_schema_path = schemas_dir / "policy.json"
-    if policy_schema_path.exists():
+    if policy_schema_path.name in schema_names:
         policy_schema = load_schema(policy_schema_path)
         if policy_schema:
             try:
                 # Validate the schema itself
-                jsonschema.Draft7Validator.check_schema(policy_schema)
+                get_validator(policy_schema)
                 print(f"[OK] Schema valid: {policy_schema_path}")
+                validate_policy = compile_validator(policy_schema)
 
                 # Validate all policy files
-                policies_dir = Path("policies")
-                if policies_dir.exists():
-                    policy_files = list(policies_dir.glob("*.json"))
-                    for policy_file in policy_files:
+                policy_files = scan_json(Path("policies"))
+                if policy_files is not None:
+                    for entry in policy_files:
+                        policy_file = Path(entry.path)
                         try:
-                            with open(policy_file, encoding="utf-8") as f:
-                                policy_data = json.load(f)
-                            jsonschema.validate(policy_data, policy_schema)
+                            policy_data = ujson.loads(policy_file.read_bytes())
+                            validate_policy(policy_data)
                             print(f"[OK] Policy validates: {policy_file.name}")
                         except Exception as e:
                             print(f"[ERROR] Policy validation failed: {policy_file.name} - {e}")
@@ -205,7 +254,7 @@ def validate_schemas() -> int:
 
     # Summary
     if errors == 0:
-        print(f"\n[OK] All schemas valid ({len(list(schemas_dir.glob('*.json')))} checked)")
+        print(f"\n[OK] All schemas valid ({len(schema_files)} checked)")
         return 0
     else:
         print(f"\n[ERROR] {errors} schema validation errors")
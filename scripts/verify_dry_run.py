@@ -27,10 +27,28 @@
 import argparse
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 
 import httpx
 
+try:
+    # optional: lets httpx negotiate HTTP/2 with api.github.com
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Upper bound on pages of 100 runs fetched per check
+MAX_RUN_PAGES = 10
+
+# Initial tail window when reading the audit log from the end
+AUDIT_TAIL_BYTES = 16384
+
+# Shared client so repeated requests reuse the pooled TCP/TLS connection
+_client = httpx.Client(http2=HTTP2_AVAILABLE, timeout=10, headers={"Accept": "application/vnd.github+json"})
+
 
 def check_github_workflows(hours: int = 24, verbose: bool = False) -> dict:
     """Check recent workflow runs via GitHub API.
@@ -50,21 +68,23 @@ def check_github_workflows(hours: int = 24, verbose: bool = False) -> dict:
     if token := os.getenv("GITHUB_TOKEN"):
         headers["Authorization"] = f"token {token}"
 
-    try:
-        response = httpx.get(url, headers=headers, params={"per_page": 100}, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-    except Exception as e:
-        return {"error": f"Failed to fetch workflow runs: {e}", "success": False}
-
-    # Filter runs from last N hours
+    # Let GitHub apply the time window, and follow pagination up to MAX_RUN_PAGES
     cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
+    params = {"per_page": 100, "created": f">={cutoff.strftime('%Y-%m-%dT%H:%M:%SZ')}"}
     recent_runs = []
 
-    for run in data.get("workflow_runs", []):
-        run_time = datetime.fromisoformat(run["created_at"].replace("Z", "+00:00"))
-        if run_time >= cutoff:
-            recent_runs.append(run)
+    try:
+        for _ in range(MAX_RUN_PAGES):
+            response = _client.get(url, headers=headers, params=params)
+            response.raise_for_status()
+            recent_runs.extend(response.json().get("workflow_runs", []))
+            next_link = response.links.get("next")
+            if not next_link:
+                break
+            # The next link already carries the query string
+            url, params = next_link["url"], None
+    except Exception as e:
+        return {"error": f"Failed to fetch workflow runs: {e}", "success": False}
 
     if not recent_runs:
         return {
@@ -75,19 +95,27 @@ def check_github_workflows(hours: int = 24, verbose: bool = False) -> dict:
 
     # Analyze runs
     total = len(recent_runs)
-    succeeded = sum(1 for r in recent_runs if r["conclusion"] == "success")
-    failed = sum(1 for r in recent_runs if r["conclusion"] == "failure")
-    in_progress = sum(1 for r in recent_runs if r["status"] == "in_progress")
+    succeeded = failed = in_progress = 0
+    for r in recent_runs:
+        if r["conclusion"] == "success":
+            succeeded += 1
+        elif r["conclusion"] == "failure":
+            failed += 1
+        if r["status"] == "in_progress":
+            in_progress += 1
 
     success_rate = (succeeded / total * 100) if total > 0 else 0
 
     if verbose:
-        print(f"\nWorkflow Runs (Last {hours}h):")
-        print(f"   Total: {total}")
-        print(f"   Succeeded: {succeeded}")
-        print(f"   Failed: {failed}")
-        print(f"   In Progress: {in_progress}")
-        print(f"   Success Rate: {success_rate:.1f}%")
+        # One print per block so output stays contiguous while checks run concurrently
+        print(
+            f"\nWorkflow Runs (Last {hours}h):\n"
+            f"   Total: {total}\n"
+            f"   Succeeded: {succeeded}\n"
+            f"   Failed: {failed}\n"
+            f"   In Progress: {in_progress}\n"
+            f"   Success Rate: {success_rate:.1f}%"
+        )
 
     return {
         "success": True,
@@ -117,23 +145,28 @@ def check_redis_flags(verbose: bool = False) -> dict:
         import redis
 
         r = redis.from_url(redis_url, decode_responses=True, socket_connect_timeout=5)
-        r.ping()
 
-        flags = r.mget(
+        # PING and MGET in one round-trip
+        pipe = r.pipeline(transaction=False)
+        pipe.ping()
+        pipe.mget(
             "flags:google:enabled",
             "flags:google:internal_only",
             "flags:google:rollout_percent",
             "flags:google:paused",
         )
+        _, flags = pipe.execute()
 
         enabled, internal_only, rollout_percent, paused = flags
 
         if verbose:
-            print("\nRedis Flags:")
-            print(f"   enabled: {enabled}")
-            print(f"   internal_only: {internal_only}")
-            print(f"   rollout_percent: {rollout_percent}")
-            print(f"   paused: {paused}")
+            print(
+                "\nRedis Flags:\n"
+                f"   enabled: {enabled}\n"
+                f"   internal_only: {internal_only}\n"
+                f"   rollout_percent: {rollout_percent}\n"
+                f"   paused: {paused}"
+            )
 
         # Check expected state for dry-run
         issues = []
@@ -156,6 +189,33 @@ def check_redis_flags(verbose: bool = False) -> dict:
         return {"error": f"Failed to connect to Redis: {e}", "success": False}
 
 
+def read_last_log_entries(log_path: str, count: int) -> list[str]:
+    """Return up to `count` table rows from the end of a markdown log, newest first.
+
+    Reads a tail window from the end of the file, doubling it until enough rows
+    are found or the whole file has been read.
+    """
+    with open(log_path, "rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        window = AUDIT_TAIL_BYTES
+        while True:
+            start = max(0, size - window)
+            f.seek(start)
+            lines = f.read().decode("utf-8", errors="ignore").split("\n")
+            if start > 0:
+                lines = lines[1:]  # probably cut mid-line
+
+            entries = []
+            for line in reversed(lines):
+                if line.startswith("|") and "Timestamp" not in line and "---" not in line:
+                    entries.append(line.strip())
+                    if len(entries) >= count:
+                        return entries
+            if start == 0:
+                return entries
+            window *= 2
+
+
 def check_audit_log(verbose: bool = False) -> dict:
     """Check audit log for recent entries.
 
@@ -174,21 +234,12 @@ def check_audit_log(verbose: bool = False) -> dict:
         }
 
     try:
-        with open(log_path, encoding="utf-8") as f:
-            lines = f.readlines()
-
         # Parse last 10 entries (skip header)
-        entries = []
-        for line in reversed(lines):
-            if line.startswith("|") and "Timestamp" not in line and "---" not in line:
-                entries.append(line.strip())
-                if len(entries) >= 10:
-                    break
+        entries = read_last_log_entries(log_path, 10)
 
         if verbose:
-            print(f"\nAudit Log (Last {len(entries)} entries):")
-            for entry in reversed(entries):
-                print(f"   {entry[:100]}...")
+            rows = [f"   {entry[:100]}..." for entry in reversed(entries)]
+            print("\n".join([f"\nAudit Log (Last {len(entries)} entries):", *rows]))
 
         # Check for DRY RUN entries
         dry_run_count = sum(1 for e in entries if "[DRY RUN]" in e)
@@ -311,10 +362,12 @@ def main():
 
     print(f"\nChecking rollout controller health (last {args.hours}h)...\n")
 
-    # Run checks
-    workflows = check_github_workflows(hours=args.hours, verbose=args.verbose)
-    redis = check_redis_flags(verbose=args.verbose)
-    audit = check_audit_log(verbose=args.verbose)
+    # Run checks concurrently; they're independent and each waits on I/O (HTTP, Redis, disk)
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        workflows_future = pool.submit(check_github_workflows, hours=args.hours, verbose=args.verbose)
+        redis_future = pool.submit(check_redis_flags, verbose=args.verbose)
+        audit_future = pool.submit(check_audit_log, verbose=args.verbose)
+        workflows, redis, audit = workflows_future.result(), redis_future.result(), audit_future.result()
 
     # Print report
     all_healthy = print_health_report(workflows, redis, audit, args.hours)
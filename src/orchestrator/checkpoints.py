@@ -7,6 +7,7 @@
 Sprint 34A: Added multi-sign (M-of-N) approval support.
 """
 
+import heapq
 import json
 import os
 from datetime import UTC, datetime, timedelta
@@ -92,13 +93,16 @@ def create_checkpoint(
     return checkpoint
 
 
-def list_checkpoints(tenant: str | None = None, status: str | None = None) -> list[dict[str, Any]]:
+def list_checkpoints(
+    tenant: str | None = None, status: str | None = None, limit: int | None = None
+) -> list[dict[str, Any]]:
     """
     List checkpoints with optional filters.
 
     Args:
         tenant: Filter by tenant (None for all)
         status: Filter by status (pending, approved, rejected, expired)
+        limit: Return at most this many of the most recent matches (None for all)
 
     Returns:
         List of checkpoint records (most recent first)
@@ -129,7 +133,10 @@ def list_checkpoints(tenant: str | None = None, status: str | None = None) -> li
     if status:
         results = [c for c in results if c.get("status") == status]
 
-    # Sort by created_at descending
+    # Sort by created_at descending; with a limit only the top entries need ordering
+    if limit is not None:
+        return heapq.nlargest(limit, results, key=lambda x: x.get("created_at", ""))
+
     results.sort(key=lambda x: x.get("created_at", ""), reverse=True)
 
     return results
@@ -5,7 +5,7 @@
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """Represents a single task in a DAG."""
 
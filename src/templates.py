@@ -603,6 +603,7 @@ def create_template_artifact(
     rendered_body: str,
     result: dict[str, Any],
     cost_projection: dict[str, Any] | None = None,
+    timestamp: int | None = None,
 ) -> dict[str, Any]:
     """
     Create artifact JSON for template run.
@@ -613,6 +614,7 @@ def create_template_artifact(
         rendered_body: Rendered template text
         result: DJP result dict
         cost_projection: Optional cost projection data
+        timestamp: Optional run timestamp (defaults to now), so callers can reuse it for filenames
 
     Returns:
         Artifact dictionary
@@ -628,7 +630,7 @@ def create_template_artifact(
         "provenance": {
             "template_body": rendered_body,
             "resolved_inputs": variables,
-            "timestamp": int(time.time()),
+            "timestamp": timestamp if timestamp is not None else int(time.time()),
         },
         "result": result,
     }
@@ -955,7 +955,7 @@ async def get_audit_logs(
     # Build query
     query = """
         SELECT
-            id,
+            public_id AS id,
             run_id,
             request_id,
             workspace_id,
@@ -330,3 +330,28 @@ def test_default_role_is_viewer(
 
     # Should indicate insufficient permissions
     assert "cannot approve" in output.lower() or "viewer" in output.lower()
+
+
+def test_list_command_limit(
+    capsys,
+    sample_checkpoints,
+    temp_checkpoints_path: Path,
+    temp_state_store: Path,
+):
+    """Test list command keeps the most recent checkpoints and notes the truncation."""
+    # Both fixtures can share a timestamp; make run2 strictly newer
+    created = {"run1_approval": "2025-01-01T00:00:00+00:00", "run2_approval": "2025-01-02T00:00:00+00:00"}
+    records = [json.loads(line) for line in temp_checkpoints_path.read_text(encoding="utf-8").splitlines()]
+    for record in records:
+        record["created_at"] = created[record["checkpoint_id"]]
+    temp_checkpoints_path.write_text("".join(json.dumps(r) + "\n" for r in records), encoding="utf-8")
+
+    exit_code = list_command(limit=1)
+
+    assert exit_code == 0
+
+    output = capsys.readouterr().out
+
+    assert "run2_approval" in output
+    assert "run1_approval" not in output
+    assert "showing first 1" in output
@@ -0,0 +1,77 @@
+"""Unit tests for nightshift_runner task file parsing."""
+
+from nightshift_runner import parse_task_file
+
+
+def test_front_matter_parsing(tmp_path):
+    """Front matter values are parsed and typed."""
+    task_file = tmp_path / "fm.task.md"
+    task_file.write_text(
+        '---\ntask: "Summarize the report"\nmax_tokens: 800\ntemperature: 0.5\nfastpath: true\npolicy: openai_preferred\n---\n'
+        "Body text\n",
+        encoding="utf-8",
+    )
+
+    parsed = parse_task_file(task_file)
+
+    assert parsed["task"] == "Summarize the report"
+    assert parsed["max_tokens"] == 800
+    assert parsed["temperature"] == 0.5
+    assert parsed["fastpath"] is True
+    assert parsed["policy"] == "openai_preferred"
+
+
+def test_front_matter_task_skips_key_value_fallback(tmp_path):
+    """KEY: VALUE lines in the body don't override a task supplied by front matter."""
+    task_file = tmp_path / "fm_body.task.md"
+    task_file.write_text("---\ntask: From front matter\n---\nTASK: From body\n", encoding="utf-8")
+
+    assert parse_task_file(task_file)["task"] == "From front matter"
+
+
+def test_key_value_fallback(tmp_path):
+    """KEY: VALUE lines are parsed when there is no front matter."""
+    task_file = tmp_path / "kv.task.md"
+    task_file.write_text(
+        "TASK: Write a brief\nMAX_TOKENS: 600\nREQUIRE_CITATIONS: 2\nfastpath: yes\n", encoding="utf-8"
+    )
+
+    parsed = parse_task_file(task_file)
+
+    assert parsed["task"] == "Write a brief"
+    assert parsed["max_tokens"] == 600
+    assert parsed["require_citations"] == 2
+    assert parsed["fastpath"] is True
+
+
+def test_parse_reflects_file_edits(tmp_path):
+    """Cached parses are invalidated when the file changes."""
+    task_file = tmp_path / "edit.task.md"
+    task_file.write_text("TASK: first\n", encoding="utf-8")
+    assert parse_task_file(task_file)["task"] == "first"
+
+    task_file.write_text("TASK: second version\n", encoding="utf-8")
+    assert parse_task_file(task_file)["task"] == "second version"
+
+
+def test_missing_task_defaults(tmp_path):
+    """Files without a task keep defaults and a None task."""
+    task_file = tmp_path / "empty.task.md"
+    task_file.write_text("nothing here\n", encoding="utf-8")
+
+    parsed = parse_task_file(task_file)
+
+    assert parsed["task"] is None
+    assert parsed["max_tokens"] == 1200
+    assert parsed["policy"] == "openai_only"
+
+
+def test_front_matter_after_leading_whitespace(tmp_path):
+    """Front matter is found when the file starts with blank lines."""
+    task_file = tmp_path / "ws.task.md"
+    task_file.write_text("\n  \n---\ntask: Indented start\nmax_tokens: 900\n---\n", encoding="utf-8")
+
+    parsed = parse_task_file(task_file)
+
+    assert parsed["task"] == "Indented start"
+    assert parsed["max_tokens"] == 900
@@ -0,0 +1,50 @@
+"""Tests for the scripts/replay.py --list index."""
+
+import json
+import os
+
+from scripts.replay import INDEX_NAME, update_run_index
+
+
+def _write_artifact(runs_dir, name, task, mtime_ns):
+    path = runs_dir / name
+    path.write_text(json.dumps({"run_metadata": {"task": task}, "publish": {"status": "published"}}), encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+    return path
+
+
+def test_index_only_parses_new_or_changed_artifacts(tmp_path):
+    """Unchanged artifacts are served from the index; edits and deletions are picked up."""
+    _write_artifact(tmp_path, "a.json", "first", 1_000_000_000)
+    _write_artifact(tmp_path, "b.json", "second", 2_000_000_000)
+
+    entries = {e["name"]: e for e in update_run_index(str(tmp_path))}
+    assert entries["a.json"]["task_preview"] == "first"
+    assert entries["b.json"]["status"] == "published"
+    assert len((tmp_path / INDEX_NAME).read_text(encoding="utf-8").splitlines()) == 2
+
+    # Second listing appends nothing
+    update_run_index(str(tmp_path))
+    assert len((tmp_path / INDEX_NAME).read_text(encoding="utf-8").splitlines()) == 2
+
+    _write_artifact(tmp_path, "a.json", "edited", 3_000_000_000)
+    (tmp_path / "b.json").unlink()
+
+    entries = {e["name"]: e for e in update_run_index(str(tmp_path))}
+    assert set(entries) == {"a.json"}
+    assert entries["a.json"]["task_preview"] == "edited"
+
+
+def test_index_records_unreadable_artifacts(tmp_path):
+    """Artifacts that fail to parse are listed with their error."""
+    (tmp_path / "broken.json").write_text("{not json", encoding="utf-8")
+
+    (entry,) = update_run_index(str(tmp_path))
+
+    assert entry["name"] == "broken.json"
+    assert "Cannot load artifact" in entry["error"]
+
+
+def test_missing_runs_dir(tmp_path):
+    """A missing runs directory lists nothing."""
+    assert update_run_index(str(tmp_path / "nope")) == []
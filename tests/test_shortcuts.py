@@ -77,6 +77,27 @@ def test_unregister_action():
     assert registry.get_action("to_remove") is None
 
 
+def test_search_actions_case_insensitive_custom_action():
+    """Registered actions are searchable case-insensitively until unregistered."""
+    registry = ShortcutRegistry()
+
+    registry.register(
+        ShortcutAction(
+            action_id="custom_export",
+            action_type=ActionType.EXPORT_ARTIFACT,
+            label="Quarterly REPORT",
+            description="Export Quarterly Numbers",
+            category="Reports",
+        )
+    )
+
+    assert registry.search_actions("quarterly report")[0].action_id == "custom_export"
+    assert any(a.action_id == "custom_export" for a in registry.search_actions("REPORTS"))
+
+    registry.unregister("custom_export")
+    assert not any(a.action_id == "custom_export" for a in registry.search_actions("quarterly"))
+
+
 def test_get_actions_by_category():
     """Can filter actions by category."""
     registry = ShortcutRegistry()
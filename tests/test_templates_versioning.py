@@ -81,6 +81,29 @@ def test_artifact_includes_provenance():
     assert "timestamp" in artifact["provenance"]
 
 
+def test_artifact_uses_supplied_timestamp():
+    """Artifacts should reuse a caller-supplied run timestamp."""
+    template = TemplateDef(
+        path=Path("test.yaml"),
+        name="Test",
+        version="1.0",
+        description="Test",
+        context="markdown",
+        inputs=[],
+        body="Test",
+    )
+
+    artifact = create_template_artifact(
+        template=template,
+        variables={},
+        rendered_body="Test",
+        result={"status": "published", "provider": "test", "text": "output", "reason": "", "usage": []},
+        timestamp=1700000000,
+    )
+
+    assert artifact["provenance"]["timestamp"] == 1700000000
+
+
 def test_artifact_includes_cost_projection():
     """Artifacts should include cost projection if provided."""
     template = TemplateDef(